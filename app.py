@@ -3,20 +3,19 @@
 import streamlit as st
 import os
 import logging
-import json
+import queue
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from dotenv import load_dotenv
-from typing import List
-
-from src.services.arxiv_service import ArxivService
-from src.services.pdf_service import PdfService
-from src.services.llm_service import LLMService
-from src.services.llm_providers import AnthropicProvider
-from src.services.audio_service import AudioService
-from src.services.tts_providers import OpenAITTSProvider
-from src.pipeline.paper_pipeline import PaperPipeline
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
 from src.models.paper import Paper
 
+# Services pull in the arXiv, Anthropic, OpenAI and MarkItDown SDKs, so they
+# are imported lazily in init_services() to keep the first paint fast
+if TYPE_CHECKING:
+    from src.services.library_index import LibraryIndex
+    from src.pipeline.paper_pipeline import PaperPipeline
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -37,12 +36,30 @@ st.set_page_config(
 # ============================================================================
 
 LIBRARY_CACHE_TTL = 300  # seconds (5 minutes)
+SEARCH_CACHE_TTL = 600  # seconds (10 minutes)
 DEFAULT_MAX_RESULTS = 5
 DEFAULT_EXACT_MATCH = True
 EXTRACT_TEXT_PREVIEW_LIMIT = 5000  # characters
+TEXT_PREVIEW_CACHE_MAX_ENTRIES = 200  # file versions kept by read_text_preview
 TITLE_TRUNCATE_SHORT = 50  # characters
 TITLE_TRUNCATE_LONG = 60  # characters
 MAX_AUTHORS_DISPLAY = 3
+FILE_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+MAX_PROCESSING_WORKERS = 8  # papers processed concurrently
+
+PIPELINE_STAGES = ["download", "extract", "summarize", "audio"]
+STAGE_START_MESSAGES = {
+    "download": "📥 Downloading PDF...",
+    "extract": "📄 Extracting text from PDF...",
+    "summarize": "🤖 Generating summary with AI...",
+    "audio": "🎙️ Generating podcast audio...",
+}
+STAGE_FAILURE_LABELS = {
+    "download": "download",
+    "extract": "extraction",
+    "summarize": "summarization",
+    "audio": "audio generation",
+}
 
 
 # ============================================================================
@@ -79,27 +96,30 @@ def format_authors(authors, max_display: int = MAX_AUTHORS_DISPLAY) -> str:
     return authors_str
 
 
+def format_search_caption(paper: Paper) -> str:
+    """Format the authors/date caption shown under a search result."""
+    return f"👤 {format_authors(paper.authors)} • 📅 {paper.published.strftime('%Y-%m-%d')}"
+
+
 # ============================================================================
 # Session State Initialization
 # ============================================================================
 
 def init_session_state():
     """Initialize session state variables."""
-    if "search_results" not in st.session_state:
+    # Plain state only needs seeding once per session
+    if not st.session_state.get("_initialized", False):
         st.session_state.search_results = []
-
-    if "selected_papers" not in st.session_state:
-        st.session_state.selected_papers = set()
-
-    if "library" not in st.session_state:
+        st.session_state.search_captions = {}
+        st.session_state.selected_papers = {}
         st.session_state.library = []
-
-    if "current_view" not in st.session_state:
+        st.session_state.prepared_downloads = set()
         st.session_state.current_view = "search"
-
-    if "processing_complete" not in st.session_state:
         st.session_state.processing_complete = False
+        st.session_state._initialized = True
 
+    # Widget-backed keys are dropped by Streamlit whenever their widget isn't
+    # rendered (e.g. in the library view), so they are checked on every run
     if "exact_match" not in st.session_state:
         st.session_state.exact_match = DEFAULT_EXACT_MATCH
 
@@ -114,6 +134,15 @@ def init_session_state():
 @st.cache_resource
 def init_services():
     """Initialize all services (cached across reruns)."""
+    from dotenv import load_dotenv
+    from src.services.arxiv_service import ArxivService
+    from src.services.pdf_service import PdfService
+    from src.services.llm_service import LLMService
+    from src.services.llm_providers import AnthropicProvider
+    from src.services.audio_service import AudioService
+    from src.services.tts_providers import OpenAITTSProvider
+    from src.pipeline.paper_pipeline import PaperPipeline
+
     load_dotenv()
 
     anthropic_api_key = os.getenv("ANTHROPIC_API_KEY")
@@ -124,86 +153,90 @@ def init_services():
         st.stop()
 
     arxiv_service = ArxivService()
-    pdf_service = PdfService()
-    llm_provider = AnthropicProvider(api_key=anthropic_api_key)
-    llm_service = LLMService(provider=llm_provider, prompts_dir="prompts")
-    tts_provider = OpenAITTSProvider(api_key=openai_api_key)
-    audio_service = AudioService(provider=tts_provider)
+    pdf_service = PdfService(extraction_workers=min(os.cpu_count() or 1, MAX_PROCESSING_WORKERS))
 
+    # Provider clients are only created once papers are processed
     pipeline = PaperPipeline(
         arxiv_service=arxiv_service,
         pdf_service=pdf_service,
-        llm_service=llm_service,
-        audio_service=audio_service,
+        llm_service=lambda: LLMService(
+            provider=AnthropicProvider(api_key=anthropic_api_key),
+            prompts_dir="prompts",
+        ),
+        audio_service=lambda: AudioService(
+            provider=OpenAITTSProvider(api_key=openai_api_key),
+        ),
         storage_dir=Path("data"),
     )
 
     return {
         "arxiv": arxiv_service,
         "pipeline": pipeline,
+        "library": pipeline.library_index,
     }
 
 
+@st.cache_data(ttl=SEARCH_CACHE_TTL)
+def search_arxiv(topic: str, exact: bool, max_results: int) -> List[Paper]:
+    """Search arXiv, caching results for repeated identical queries."""
+    return init_services()["arxiv"].search_by_topic(
+        topic=topic,
+        exact=exact,
+        max_results=max_results
+    )
+
+
 # ============================================================================
 # Library Loading
 # ============================================================================
 
 @st.cache_data(ttl=LIBRARY_CACHE_TTL)
-def load_library_from_disk() -> List[dict]:
-    """Load processed papers from the data directory."""
-    data_dir = Path("data/papers")
+def load_library_from_disk(_library_index: "LibraryIndex") -> List[dict]:
+    """Load processed papers from the library index.
 
-    if not data_dir.exists():
+    The index is kept up to date by the pipeline and rebuilt from the
+    data directory when it no longer matches the paper directories.
+    """
+    try:
+        library = _library_index.load()
+    except Exception as e:
+        logger.error(f"Error loading library index: {e}", exc_info=True)
         return []
 
-    library = []
-
-    for paper_dir in data_dir.iterdir():
-        if not paper_dir.is_dir():
-            continue
-
-        # Look for paper_state.json
-        state_file = paper_dir / "paper_state.json"
-        if not state_file.exists():
-            continue
-
-        try:
-            # Load paper from disk
-            with open(state_file, 'r') as f:
-                paper_data = json.load(f)
-
-            # Check if audio exists
-            audio_dir = paper_dir / "audio"
-            audio_files = list(audio_dir.glob("*.mp3")) if audio_dir.exists() else []
-
-            # Check if summary exists
-            summary_dir = paper_dir / "summaries"
-            summary_files = list(summary_dir.glob("summary_*.txt")) if summary_dir.exists() else []
-
-            # Check if extracted content exists
-            extract_dir = paper_dir / "extracted"
-            extract_files = list(extract_dir.glob("*.md")) if extract_dir.exists() else []
-
-            library.append({
-                "title": paper_data.get("title", "Unknown"),
-                "arxiv_id": paper_data.get("arxiv_id", ""),
-                "authors": paper_data.get("authors", []),
-                "status": paper_data.get("status", "unknown"),
-                "abstract": paper_data.get("abstract", ""),
-                "audio_path": audio_files[0] if audio_files else None,
-                "summary_path": summary_files[0] if summary_files else None,
-                "extract_path": extract_files[0] if extract_files else None,
-                "paper_dir": paper_dir,
-                "listen_status": paper_data.get("listen_status", "unlistened"),
-                "last_listened_at": paper_data.get("last_listened_at", None),
-            })
-        except Exception as e:
-            logger.error(f"Error loading paper from {paper_dir}: {e}")
-            continue
+    # Precompute display strings once per load rather than on every rerun
+    for paper_info in library:
+        paper_info["authors_str"] = format_authors(paper_info["authors"])
 
     return library
 
 
+@st.cache_data(ttl=LIBRARY_CACHE_TTL, max_entries=TEXT_PREVIEW_CACHE_MAX_ENTRIES)
+def read_text_preview(path: str, mtime: float, limit: Optional[int] = None) -> Tuple[str, bool]:
+    """Read (the start of) a text file for display, cached per file version.
+
+    Only about ``limit`` characters are read from disk, so previews of large
+    extractions don't decode the whole file on every rerun.
+
+    Args:
+        path: Path to the text file
+        mtime: File modification time (part of the cache key)
+        limit: Maximum number of characters to return (None reads everything)
+
+    Returns:
+        Tuple of (text, truncated)
+    """
+    if limit is None:
+        return Path(path).read_text(encoding="utf-8", errors="replace"), False
+
+    with open(path, "rb") as f:
+        raw = f.read(limit * 4)  # UTF-8 uses at most 4 bytes per character
+        has_more = bool(f.read(1))
+
+    text = raw.decode("utf-8", errors="replace")
+    truncated = has_more or len(text) > limit
+    return text[:limit], truncated
+
+
 # ============================================================================
 # UI Components
 # ============================================================================
@@ -248,7 +281,7 @@ def render_search_interface(services):
     # Handle clear button
     if clear_button:
         st.session_state.search_results = []
-        st.session_state.selected_papers = set()
+        st.session_state.selected_papers = {}
         st.rerun()
 
     # Search options (outside form so they don't reset)
@@ -263,19 +296,26 @@ def render_search_interface(services):
     if (search_button or auto_search) and search_query:
         with st.spinner("Searching arXiv..."):
             try:
-                results = services["arxiv"].search_by_topic(
-                    topic=search_query,
-                    exact=exact_match,
-                    max_results=max_results
-                )
+                results = search_arxiv(search_query, exact_match, max_results)
                 st.session_state.search_results = results
-                st.session_state.selected_papers = set()
+                st.session_state.search_captions = {
+                    paper.arxiv_id: format_search_caption(paper) for paper in results
+                }
+                st.session_state.selected_papers = {}
                 st.toast(f"✅ Found {len(results)} paper{'s' if len(results) != 1 else ''}", icon="🔍")
             except Exception as e:
                 st.error(f"Search failed: {e}")
                 logger.error(f"Search error: {e}", exc_info=True)
 
 
+def toggle_paper_selection(paper: Paper, checkbox_key: str):
+    """Update the selected papers (keyed by arxiv_id) when a result checkbox changes."""
+    if st.session_state[checkbox_key]:
+        st.session_state.selected_papers[paper.arxiv_id] = paper
+    else:
+        st.session_state.selected_papers.pop(paper.arxiv_id, None)
+
+
 def render_search_results(services):
     """Render search results with selection checkboxes."""
     if not st.session_state.search_results:
@@ -317,25 +357,21 @@ def render_search_results(services):
             col1, col2 = st.columns([0.1, 0.9])
 
             with col1:
-                selected = st.checkbox(
+                checkbox_key = f"paper_{i}"
+                st.checkbox(
                     "Select",
-                    key=f"paper_{i}",
+                    key=checkbox_key,
                     value=paper.arxiv_id in st.session_state.selected_papers,
+                    on_change=toggle_paper_selection,
+                    args=(paper, checkbox_key),
                     label_visibility="collapsed"
                 )
 
-                if selected:
-                    st.session_state.selected_papers.add(paper.arxiv_id)
-                elif paper.arxiv_id in st.session_state.selected_papers:
-                    st.session_state.selected_papers.remove(paper.arxiv_id)
-
             with col2:
                 st.markdown(f"**{paper.title}**")
 
-                # Authors
-                authors_str = format_authors(paper.authors)
-
-                st.caption(f"👤 {authors_str} • 📅 {paper.published.strftime('%Y-%m-%d')}")
+                # Authors and date (formatted once at search time)
+                st.caption(st.session_state.search_captions.get(paper.arxiv_id, ""))
 
                 # Abstract preview
                 with st.expander("View Abstract"):
@@ -356,116 +392,152 @@ def render_search_results(services):
 
 def format_file_size(size_bytes: int) -> str:
     """Format file size in human-readable format."""
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.1f} TB"
+    if size_bytes <= 0:
+        return f"0.0 {FILE_SIZE_UNITS[0]}"
+    # Each unit is 2**10 larger, so the unit index follows from the bit length
+    unit_index = min(len(FILE_SIZE_UNITS) - 1, (int(size_bytes).bit_length() - 1) // 10)
+    return f"{size_bytes / (1 << (10 * unit_index)):.1f} {FILE_SIZE_UNITS[unit_index]}"
 
 
-def process_selected_papers(pipeline: PaperPipeline):
-    """Process selected papers through the pipeline with real-time progress tracking."""
-    selected_papers = [
-        paper for paper in st.session_state.search_results
-        if paper.arxiv_id in st.session_state.selected_papers
-    ]
+def describe_stage_result(stage: str, stage_result) -> str:
+    """Describe a completed pipeline stage for the progress log.
+
+    Args:
+        stage: Pipeline stage name
+        stage_result: Result object returned by that stage
+
+    Returns:
+        Human-readable progress message
+    """
+    if stage == "download":
+        pdf_size = stage_result.pdf_path.stat().st_size
+        return f"✅ Downloaded PDF ({format_file_size(pdf_size)})"
+
+    if stage == "extract":
+        return f"✅ Extracted {stage_result.character_count:,} characters"
+
+    if stage == "summarize":
+        summary_length = len(stage_result.summary_text)
+        word_count = len(stage_result.summary_text.split())
+        return f"✅ Generated summary ({word_count:,} words, {summary_length:,} characters)"
+
+    audio_size = stage_result.audio_path.stat().st_size
+    duration_info = ""
+    if stage_result.audio_duration_seconds:
+        mins = int(stage_result.audio_duration_seconds // 60)
+        secs = int(stage_result.audio_duration_seconds % 60)
+        duration_info = f", {mins}:{secs:02d}"
+    return f"✅ Generated audio ({format_file_size(audio_size)}{duration_info})"
+
+
+def _run_pipeline(pipeline: "PaperPipeline", paper: Paper, events: queue.Queue) -> None:
+    """Run every pipeline stage for a paper, reporting progress through a queue.
+
+    Runs on a worker thread, so it must not touch Streamlit directly. Each
+    event is a ``(arxiv_id, event, message)`` tuple rendered by the main thread;
+    a final ``"done"`` event is always emitted.
+
+    Args:
+        pipeline: Pipeline used to process the paper
+        paper: Paper to process
+        events: Queue receiving progress events
+    """
+    title = paper.title[:TITLE_TRUNCATE_SHORT]
+    current_stage = PIPELINE_STAGES[0]
+
+    def emit(event: str, message: str = "") -> None:
+        events.put((paper.arxiv_id, event, message))
+
+    def on_stage(stage: str, stage_result) -> None:
+        nonlocal current_stage
+        current_stage = stage
+        if stage_result is None:
+            emit("progress", STAGE_START_MESSAGES[stage])
+        else:
+            emit("progress", describe_stage_result(stage, stage_result))
+
+    try:
+        # All stages run in a single pipeline call; on_stage streams progress
+        result = pipeline.process_paper(paper, stages=PIPELINE_STAGES, on_stage=on_stage)
+
+        if result.errors:
+            stage_label = STAGE_FAILURE_LABELS[current_stage]
+            emit("error", f"{stage_label.capitalize()} error: {result.errors[0]}")
+            emit("failed", f"❌ Failed at {stage_label}: {title}")
+        elif result.is_successful:
+            emit("complete")
+        else:
+            emit("partial")
+
+    except Exception as e:
+        emit("error", f"Error processing {paper.title}: {e}")
+        emit("failed", f"❌ Error: {title}")
+        logger.error(f"Processing error: {e}", exc_info=True)
+
+    finally:
+        emit("done")
+
+
+def process_selected_papers(pipeline: "PaperPipeline"):
+    """Process selected papers concurrently with real-time progress tracking.
+
+    Each paper runs on a worker thread; progress events are drained from a
+    queue on the main thread, which is the only one allowed to update the UI.
+    """
+    selected_papers = list(st.session_state.selected_papers.values())
 
     if not selected_papers:
         st.warning("No papers selected")
         return
 
+    # Lay out one status container per paper up front so workers can report in any order
+    statuses = {}
     for i, paper in enumerate(selected_papers):
         st.subheader(f"Processing {i+1}/{len(selected_papers)}: {paper.title}")
+        statuses[paper.arxiv_id] = (
+            paper,
+            st.status(f"Processing {paper.title[:TITLE_TRUNCATE_SHORT]}...", expanded=True),
+        )
 
-        with st.status(f"Processing {paper.title[:TITLE_TRUNCATE_SHORT]}...", expanded=True) as status:
-            try:
-                # Stage 1: Download
-                st.write("📥 Downloading PDF...")
-                download_result = pipeline.process_paper(paper, stages=["download"])
-
-                if download_result.download:
-                    pdf_size = download_result.download.pdf_path.stat().st_size
-                    st.write(f"✅ Downloaded PDF ({format_file_size(pdf_size)})")
-                else:
-                    st.write("⚠️ Download failed or already exists")
-                    if download_result.errors:
-                        st.error(f"Download error: {download_result.errors[0]}")
-                        status.update(label=f"❌ Failed at download: {paper.title[:TITLE_TRUNCATE_SHORT]}", state="error")
-                        continue
-
-                # Stage 2: Extract
-                st.write("📄 Extracting text from PDF...")
-                extract_result = pipeline.process_paper(paper, stages=["extract"])
-
-                if extract_result.extraction:
-                    char_count = extract_result.extraction.character_count
-                    st.write(f"✅ Extracted {char_count:,} characters")
-                else:
-                    st.write("⚠️ Extraction failed")
-                    if extract_result.errors:
-                        st.error(f"Extraction error: {extract_result.errors[0]}")
-                        status.update(label=f"❌ Failed at extraction: {paper.title[:TITLE_TRUNCATE_SHORT]}", state="error")
-                        continue
-
-                # Stage 3: Summarize
-                st.write("🤖 Generating summary with AI...")
-                summary_result = pipeline.process_paper(paper, stages=["summarize"])
-
-                if summary_result.summary:
-                    summary_length = len(summary_result.summary.summary_text)
-                    word_count = len(summary_result.summary.summary_text.split())
-                    st.write(f"✅ Generated summary ({word_count:,} words, {summary_length:,} characters)")
-                else:
-                    st.write("⚠️ Summarization failed")
-                    if summary_result.errors:
-                        st.error(f"Summary error: {summary_result.errors[0]}")
-                        status.update(label=f"❌ Failed at summarization: {paper.title[:TITLE_TRUNCATE_SHORT]}", state="error")
-                        continue
-
-                # Stage 4: Audio Generation
-                st.write("🎙️ Generating podcast audio...")
-                audio_result = pipeline.process_paper(paper, stages=["audio"])
-
-                if audio_result.audio:
-                    audio_size = audio_result.audio.audio_path.stat().st_size
-                    duration_info = ""
-                    if audio_result.audio.audio_duration_seconds:
-                        mins = int(audio_result.audio.audio_duration_seconds // 60)
-                        secs = int(audio_result.audio.audio_duration_seconds % 60)
-                        duration_info = f", {mins}:{secs:02d}"
-                    st.write(f"✅ Generated audio ({format_file_size(audio_size)}{duration_info})")
-                else:
-                    st.write("⚠️ Audio generation failed")
-                    if audio_result.errors:
-                        st.error(f"Audio error: {audio_result.errors[0]}")
-                        status.update(label=f"❌ Failed at audio generation: {paper.title[:TITLE_TRUNCATE_SHORT]}", state="error")
-                        continue
-
-                # All stages complete!
-                if audio_result.is_successful:
-                    status.update(label=f"✅ Complete: {paper.title[:TITLE_TRUNCATE_SHORT]}", state="complete")
-                    st.toast(f"🎉 Successfully processed: {paper.title[:TITLE_TRUNCATE_LONG]}", icon="✅")
-                else:
-                    status.update(label=f"⚠️ Partially complete: {paper.title[:TITLE_TRUNCATE_SHORT]}", state="running")
-                    st.toast(f"⚠️ Partially completed: {paper.title[:TITLE_TRUNCATE_LONG]}", icon="⚠️")
-
-            except Exception as e:
-                status.update(label=f"❌ Error: {paper.title[:TITLE_TRUNCATE_SHORT]}", state="error")
-                st.error(f"Error processing {paper.title}: {e}")
-                logger.error(f"Processing error: {e}", exc_info=True)
+    events = queue.Queue()
+    max_workers = min(MAX_PROCESSING_WORKERS, len(selected_papers))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for paper in selected_papers:
+            executor.submit(_run_pipeline, pipeline, paper, events)
+
+        remaining = len(selected_papers)
+        while remaining:
+            paper_id, event, message = events.get()
+            paper, status = statuses[paper_id]
+
+            if event == "progress":
+                status.write(message)
+            elif event == "error":
+                status.error(message)
+            elif event == "failed":
+                status.update(label=message, state="error")
+            elif event == "complete":
+                status.update(label=f"✅ Complete: {paper.title[:TITLE_TRUNCATE_SHORT]}", state="complete")
+                st.toast(f"🎉 Successfully processed: {paper.title[:TITLE_TRUNCATE_LONG]}", icon="✅")
+            elif event == "partial":
+                status.update(label=f"⚠️ Partially complete: {paper.title[:TITLE_TRUNCATE_SHORT]}", state="running")
+                st.toast(f"⚠️ Partially completed: {paper.title[:TITLE_TRUNCATE_LONG]}", icon="⚠️")
+            elif event == "done":
+                remaining -= 1
 
     # Mark processing complete and refresh library
     st.session_state.processing_complete = True
-    st.session_state.selected_papers = set()
+    st.session_state.selected_papers = {}
     load_library_from_disk.clear()  # Clear cache to reload library
     st.rerun()
 
 
-def render_library():
+def render_library(services):
     """Render the podcast library."""
     st.subheader("📚 Your Podcast Library")
 
-    all_library = load_library_from_disk()
+    all_library = load_library_from_disk(services["library"])
 
     if not all_library:
         # Better empty state for library
@@ -520,6 +592,10 @@ def render_library():
     with col1:
         st.write(f"**{len(library)} paper{'s' if len(library) != 1 else ''} in library**")
 
+    if not library:
+        st.info("No papers match the selected filters")
+        return
+
     for paper_info in library:
 
         # Status emoji for expander label
@@ -530,9 +606,8 @@ def render_library():
         # Create expander with title and status
         with st.expander(f"{status_emoji} {listen_emoji}{paper_info['title']}", expanded=False):
             # Authors
-            if paper_info["authors"]:
-                authors_str = format_authors(paper_info["authors"])
-                st.caption(f"👤 {authors_str}")
+            if paper_info["authors_str"]:
+                st.caption(f"👤 {paper_info['authors_str']}")
 
             st.caption(f"📋 Status: {paper_info['status']}")
 
@@ -550,6 +625,7 @@ def render_library():
                         paper = Paper.load_from_disk(paper_info["title"], Path("data"))
                         if paper:
                             paper.mark_listened(Path("data"))
+                            services["library"].upsert(paper)
                             load_library_from_disk.clear()  # Clear cache
                             st.rerun()
                 else:
@@ -558,6 +634,7 @@ def render_library():
                         paper = Paper.load_from_disk(paper_info["title"], Path("data"))
                         if paper:
                             paper.mark_unlistened(Path("data"))
+                            services["library"].upsert(paper)
                             load_library_from_disk.clear()  # Clear cache
                             st.rerun()
 
@@ -572,32 +649,38 @@ def render_library():
             if paper_info["audio_path"]:
                 st.audio(str(paper_info["audio_path"]), format="audio/mpeg")
 
-                # Download buttons row
-                col1, col2 = st.columns(2)
-                with col1:
-                    # Download MP3 button
-                    with open(paper_info["audio_path"], "rb") as audio_file:
-                        st.download_button(
-                            label="⬇️ Download MP3",
-                            data=audio_file,
-                            file_name=f"{paper_info['title'][:TITLE_TRUNCATE_SHORT]}.mp3",
-                            mime="audio/mpeg",
-                            key=f"download_{paper_info['arxiv_id']}",
-                            use_container_width=True
-                        )
-                with col2:
-                    # Download PDF button if it exists
-                    pdf_files = list(paper_info["paper_dir"].glob("*.pdf"))
-                    if pdf_files:
-                        with open(pdf_files[0], "rb") as pdf_file:
+                # Download buttons row - files are only read once the user asks for them,
+                # otherwise every rerun would load every paper's MP3/PDF into memory
+                if paper_info["arxiv_id"] not in st.session_state.prepared_downloads:
+                    if st.button("⬇️ Prepare Downloads", key=f"prepare_download_{paper_info['arxiv_id']}"):
+                        st.session_state.prepared_downloads.add(paper_info["arxiv_id"])
+                        st.rerun()
+                else:
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        # Download MP3 button
+                        with open(paper_info["audio_path"], "rb") as audio_file:
                             st.download_button(
-                                label="📥 Download PDF",
-                                data=pdf_file,
-                                file_name=f"{paper_info['title'][:TITLE_TRUNCATE_SHORT]}.pdf",
-                                mime="application/pdf",
-                                key=f"download_pdf_{paper_info['arxiv_id']}",
+                                label="⬇️ Download MP3",
+                                data=audio_file,
+                                file_name=f"{paper_info['title'][:TITLE_TRUNCATE_SHORT]}.mp3",
+                                mime="audio/mpeg",
+                                key=f"download_{paper_info['arxiv_id']}",
                                 use_container_width=True
                             )
+                    with col2:
+                        # Download PDF button if it exists
+                        pdf_files = list(paper_info["paper_dir"].glob("*.pdf"))
+                        if pdf_files:
+                            with open(pdf_files[0], "rb") as pdf_file:
+                                st.download_button(
+                                    label="📥 Download PDF",
+                                    data=pdf_file,
+                                    file_name=f"{paper_info['title'][:TITLE_TRUNCATE_SHORT]}.pdf",
+                                    mime="application/pdf",
+                                    key=f"download_pdf_{paper_info['arxiv_id']}",
+                                    use_container_width=True
+                                )
             else:
                 st.info("🎙️ Audio not yet generated")
 
@@ -620,12 +703,14 @@ def render_library():
                             if content_type == "text":
                                 st.write(content)
                             elif content_type == "file":
-                                summary_text = Path(content).read_text()
+                                summary_text, _ = read_text_preview(str(content), Path(content).stat().st_mtime)
                                 st.html(summary_text)
                             elif content_type == "extract":
-                                extract_text = Path(content).read_text()
-                                if len(extract_text) > EXTRACT_TEXT_PREVIEW_LIMIT:
-                                    st.html(extract_text[:EXTRACT_TEXT_PREVIEW_LIMIT] + "...")
+                                extract_text, truncated = read_text_preview(
+                                    str(content), Path(content).stat().st_mtime, EXTRACT_TEXT_PREVIEW_LIMIT
+                                )
+                                if truncated:
+                                    st.html(extract_text + "...")
                                     st.caption(f"(Showing first {EXTRACT_TEXT_PREVIEW_LIMIT:,} characters)")
                                 else:
                                     st.html(extract_text)
@@ -689,7 +774,7 @@ def main():
         st.divider()
         render_search_results(services)
     else:  # library view
-        render_library()
+        render_library(services)
 
     # Show toast notification after processing
     if st.session_state.processing_complete:
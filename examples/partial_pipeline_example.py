@@ -47,16 +47,18 @@ def main():
 
     arxiv_service = ArxivService()
     pdf_service = PdfService()
-    llm_provider = AnthropicProvider(api_key=anthropic_api_key)
-    llm_service = LLMService(provider=llm_provider, prompts_dir="../prompts")
-    tts_provider = OpenAITTSProvider(api_key=openai_api_key)
-    audio_service = AudioService(provider=tts_provider)
 
+    # Provider clients are only created once a stage needs them
     pipeline = PaperPipeline(
         arxiv_service=arxiv_service,
         pdf_service=pdf_service,
-        llm_service=llm_service,
-        audio_service=audio_service,
+        llm_service=lambda: LLMService(
+            provider=AnthropicProvider(api_key=anthropic_api_key),
+            prompts_dir="../prompts",
+        ),
+        audio_service=lambda: AudioService(
+            provider=OpenAITTSProvider(api_key=openai_api_key),
+        ),
         storage_dir=Path("data"),
     )
 
@@ -6,7 +6,7 @@ from pathlib import Path
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AudioResult:
     """Result of generating audio from text."""
 
@@ -21,3 +21,12 @@ class AudioResult:
             "generated_at": self.generated_at.isoformat(),
             "audio_duration_seconds": self.audio_duration_seconds,
         }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "AudioResult":
+        """Create AudioResult from dictionary."""
+        return cls(
+            audio_path=Path(data["audio_path"]),
+            generated_at=datetime.fromisoformat(data["generated_at"]),
+            audio_duration_seconds=data.get("audio_duration_seconds"),
+        )
@@ -1,14 +1,17 @@
 """Result models for download operations."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DownloadResult:
     """Result of downloading a paper PDF."""
     pdf_path: Path
     save_dir: Path
     pdf_filename: str
     downloaded_at: datetime
+    # PDF contents kept in memory so extraction can skip re-reading pdf_path
+    pdf_bytes: Optional[bytes] = field(default=None, repr=False, compare=False)
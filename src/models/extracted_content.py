@@ -1,9 +1,46 @@
 """Data models for extracted PDF content."""
 
-from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
 
-@dataclass
 class ExtractedContent:
-    """Represents content extracted from a PDF using MarkItDown."""
+    """
+    Represents content extracted from a PDF using MarkItDown.
+
+    Content is either held in memory or backed by the saved markdown file,
+    in which case it is read on each access instead of being kept alive.
+    Results of batch runs therefore hold file paths rather than full papers.
+    """
+
+    __slots__ = ("_markdown", "path")
+
+    def __init__(self, markdown: Optional[str] = None, path: Optional[Path] = None):
+        """
+        Initialize extracted content.
+
+        Args:
+            markdown: Structured markdown content held in memory
+            path: Markdown file to read the content from when not in memory
+        """
+        if markdown is None and path is None:
+            raise ValueError("ExtractedContent needs markdown or a path")
+        self._markdown = markdown
+        self.path = Path(path) if path is not None else None
+
+    @classmethod
+    def from_file(cls, path: Path) -> "ExtractedContent":
+        """Create content backed by a saved markdown file."""
+        return cls(path=path)
+
+    @property
+    def markdown(self) -> str:
+        """Structured markdown content."""
+        if self._markdown is not None:
+            return self._markdown
+        return self.path.read_text(encoding="utf-8")
 
-    markdown: str  # Structured markdown content
+    def __repr__(self) -> str:
+        if self._markdown is not None:
+            return f"ExtractedContent(<{len(self._markdown)} chars in memory>)"
+        return f"ExtractedContent(path={str(self.path)!r})"
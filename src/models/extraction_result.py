@@ -6,7 +6,7 @@ from pathlib import Path
 from .extracted_content import ExtractedContent
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ExtractionResult:
     """Result of extracting content from a PDF."""
     content: ExtractedContent
@@ -17,4 +17,24 @@ class ExtractionResult:
     def __post_init__(self):
         """Calculate character count if not provided."""
         if self.character_count == 0 and self.content:
-            self.character_count = len(self.content.markdown)
+            # Frozen dataclass: bypass the generated __setattr__
+            object.__setattr__(self, "character_count", len(self.content.markdown))
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization (content stays on disk)."""
+        return {
+            "saved_path": str(self.saved_path),
+            "extracted_at": self.extracted_at.isoformat(),
+            "character_count": self.character_count,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ExtractionResult":
+        """Create ExtractionResult from dictionary, with content backed by saved_path."""
+        saved_path = Path(data["saved_path"])
+        return cls(
+            content=ExtractedContent.from_file(saved_path),
+            saved_path=saved_path,
+            extracted_at=datetime.fromisoformat(data["extracted_at"]),
+            character_count=data.get("character_count", 0),
+        )
@@ -1,22 +1,35 @@
 """Data models for research papers."""
 
-import json
-from dataclasses import dataclass, field
+import os
+import sys
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional
 
+import orjson
 
-@dataclass
+# Invalid filename characters (/ \ : * ? " < > |) mapped to underscores
+_INVALID_FILENAME_CHARS = str.maketrans({char: "_" for char in '/\\:*?"<>|'})
+
+# Paper fields serialized as ISO 8601 strings
+_DATETIME_FIELDS = ("published", "updated", "downloaded_at", "last_listened_at")
+
+
+@dataclass(slots=True)
 class Author:
     """Represents a paper author."""
     name: str
     affiliation: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, weakref_slot=True)
 class Paper:
-    """Represents a research paper from arXiv."""
+    """
+    Represents a research paper from arXiv.
+
+    Not frozen: PaperWorkflow syncs its state into the status field.
+    """
 
     arxiv_id: str
     title: str
@@ -41,11 +54,23 @@ class Paper:
     listen_status: str = "unlistened"  # States: unlistened, listened
     last_listened_at: Optional[datetime] = None
 
+    # Serialized state from the last successful save (used to skip unchanged writes)
+    _saved_state: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+
+    # (title, cleaned title) memoized by cleaned_title
+    _cleaned_title: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+
     def __post_init__(self):
-        """Ensure arxiv_id is clean (without version number for storage)."""
+        """Ensure arxiv_id is clean (without version number for storage) and intern shared strings."""
         # Remove version number if present (e.g., "2301.12345v2" -> "2301.12345")
-        if 'v' in self.arxiv_id:
-            self.arxiv_id = self.arxiv_id.split('v')[0]
+        self.arxiv_id = self.arxiv_id.partition('v')[0]
+
+        # Categories and statuses come from small vocabularies; intern them so
+        # papers loaded from disk or harvested in bulk share one copy of each
+        self.primary_category = sys.intern(self.primary_category)
+        self.categories = [sys.intern(category) for category in self.categories]
+        self.status = sys.intern(self.status)
+        self.listen_status = sys.intern(self.listen_status)
 
     @staticmethod
     def clean_filename(title: str, max_length: int = 200) -> str:
@@ -61,15 +86,9 @@ class Paper:
         Returns:
             Cleaned filename string
         """
-        # Remove invalid filename characters: / \ : * ? " < > |
-        invalid_chars = '/\\:*?"<>|'
-        cleaned = title
-        for char in invalid_chars:
-            cleaned = cleaned.replace(char, '_')
-
-        # Replace multiple spaces with single space, then spaces with underscores
-        cleaned = ' '.join(cleaned.split())
-        cleaned = cleaned.replace(' ', '_')
+        # Replace invalid filename characters in one pass, then collapse
+        # each whitespace run into a single underscore
+        cleaned = "_".join(title.translate(_INVALID_FILENAME_CHARS).split())
 
         # Limit length to avoid filesystem issues
         cleaned = cleaned[:max_length]
@@ -79,7 +98,12 @@ class Paper:
     @property
     def cleaned_title(self) -> str:
         """Get the cleaned title for use in filenames and directories."""
-        return self.clean_filename(self.title)
+        # Recompute only if the title object changed since the last call
+        cached = self._cleaned_title
+        if cached is None or cached[0] is not self.title:
+            cached = (self.title, self.clean_filename(self.title))
+            self._cleaned_title = cached
+        return cached[1]
 
     @property
     def short_id(self) -> str:
@@ -96,6 +120,11 @@ class Paper:
         """Get the first author's name."""
         return self.authors[0].name if self.authors else "Unknown"
 
+    @property
+    def authors_str(self) -> str:
+        """Get all author names as a comma-separated string."""
+        return ", ".join([author.name for author in self.authors])
+
     @property
     def pdf_path(self) -> Optional[str]:
         """Get the full path to the PDF file."""
@@ -125,53 +154,73 @@ class Paper:
         self.last_listened_at = None
         self.save_to_disk(storage_dir)
 
-    def to_dict(self) -> dict:
-        """Convert paper to dictionary for JSON serialization."""
+    def _state_dict(self) -> dict:
+        """
+        Build the serialized paper state with datetimes and authors left as objects.
+
+        orjson writes datetimes and dataclasses in C with the same output as
+        isoformat() and per-author dicts, so save_to_disk can serialize this
+        directly.
+        """
         return {
             "arxiv_id": self.arxiv_id,
             "title": self.title,
-            "authors": [{"name": a.name, "affiliation": a.affiliation} for a in self.authors],
+            "authors": self.authors,
             "abstract": self.abstract,
-            "published": self.published.isoformat(),
-            "updated": self.updated.isoformat(),
+            "published": self.published,
+            "updated": self.updated,
             "categories": self.categories,
             "primary_category": self.primary_category,
             "pdf_url": self.pdf_url,
             "comment": self.comment,
             "journal_ref": self.journal_ref,
             "doi": self.doi,
-            "downloaded_at": self.downloaded_at.isoformat() if self.downloaded_at else None,
+            "downloaded_at": self.downloaded_at,
             "save_dir": self.save_dir,
             "pdf_filename": self.pdf_filename,
             "pdf_path": self.pdf_path,
             "status": self.status,
             "listen_status": self.listen_status,
-            "last_listened_at": self.last_listened_at.isoformat() if self.last_listened_at else None,
+            "last_listened_at": self.last_listened_at,
         }
 
+    def to_dict(self) -> dict:
+        """Convert paper to dictionary for JSON serialization."""
+        data = self._state_dict()
+        data["authors"] = [{"name": a.name, "affiliation": a.affiliation} for a in self.authors]
+        for name in _DATETIME_FIELDS:
+            if data[name]:
+                data[name] = data[name].isoformat()
+        return data
+
     @classmethod
     def from_dict(cls, data: dict) -> "Paper":
         """Create Paper from dictionary."""
-        # Remove computed properties (they'll be automatically recreated)
-        data.pop("pdf_path", None)
+        # Only constructor fields are picked up; computed properties such as
+        # pdf_path are recreated, and the input dict is left untouched
+        kwargs = {name: data[name] for name in _PAPER_INIT_FIELDS if name in data}
 
         # Parse datetime strings
-        data["published"] = datetime.fromisoformat(data["published"])
-        data["updated"] = datetime.fromisoformat(data["updated"])
-        if data.get("downloaded_at"):
-            data["downloaded_at"] = datetime.fromisoformat(data["downloaded_at"])
-        if data.get("last_listened_at"):
-            data["last_listened_at"] = datetime.fromisoformat(data["last_listened_at"])
+        kwargs["published"] = datetime.fromisoformat(kwargs["published"])
+        kwargs["updated"] = datetime.fromisoformat(kwargs["updated"])
+        if kwargs.get("downloaded_at"):
+            kwargs["downloaded_at"] = datetime.fromisoformat(kwargs["downloaded_at"])
+        if kwargs.get("last_listened_at"):
+            kwargs["last_listened_at"] = datetime.fromisoformat(kwargs["last_listened_at"])
 
         # Parse authors
-        data["authors"] = [Author(**a) for a in data["authors"]]
+        kwargs["authors"] = [Author(**a) for a in kwargs["authors"]]
 
-        return cls(**data)
+        return cls(**kwargs)
 
     def save_to_disk(self, storage_dir: Path) -> Path:
         """
         Save paper state to disk for persistence across runs.
 
+        The state file is replaced atomically (write to a temp file, then
+        rename), and the write is skipped entirely when the state has not
+        changed since the last save.
+
         Args:
             storage_dir: Root storage directory (e.g., "data")
 
@@ -179,12 +228,22 @@ class Paper:
             Path to saved state file
         """
         paper_dir = storage_dir / "papers" / self.cleaned_title
-        paper_dir.mkdir(parents=True, exist_ok=True)
-
         state_file = paper_dir / "paper_state.json"
-        with open(state_file, "w", encoding="utf-8") as f:
-            json.dump(self.to_dict(), f, indent=2)
 
+        state = orjson.dumps(self._state_dict(), option=orjson.OPT_INDENT_2)
+        if state == self._saved_state and state_file.exists():
+            return state_file
+
+        tmp_file = state_file.with_suffix(".tmp")
+        try:
+            tmp_file.write_bytes(state)
+        except FileNotFoundError:
+            # Only the first save of a paper needs to create its directory
+            paper_dir.mkdir(parents=True, exist_ok=True)
+            tmp_file.write_bytes(state)
+        os.replace(tmp_file, state_file)
+
+        self._saved_state = state
         return state_file
 
     @classmethod
@@ -205,7 +264,13 @@ class Paper:
         if not state_file.exists():
             return None
 
-        with open(state_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        state = state_file.read_bytes()
+        paper = cls.from_dict(orjson.loads(state))
+
+        # A save of the unchanged paper can then skip rewriting the file
+        paper._saved_state = state
+        return paper
+
 
-        return cls.from_dict(data)
+# Constructor field names, computed once for from_dict
+_PAPER_INIT_FIELDS = tuple(f.name for f in fields(Paper) if f.init)
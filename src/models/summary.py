@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class PaperSummary:
     """Represents a generated summary of a research paper."""
 
@@ -6,7 +6,7 @@ from pathlib import Path
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SummaryResult:
     """Result of summarizing a paper."""
     summary_text: str
@@ -20,3 +20,12 @@ class SummaryResult:
             "saved_path": str(self.saved_path),
             "summarized_at": self.summarized_at.isoformat(),
         }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SummaryResult":
+        """Create SummaryResult from dictionary."""
+        return cls(
+            summary_text=data["summary_text"],
+            saved_path=Path(data["saved_path"]),
+            summarized_at=datetime.fromisoformat(data["summarized_at"]),
+        )
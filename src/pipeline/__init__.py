@@ -2,5 +2,6 @@
 
 from .paper_workflow import PaperWorkflow
 from .paper_pipeline import PaperPipeline, PipelineResult
+from .stage_cache import StageCache
 
-__all__ = ["PaperWorkflow", "PaperPipeline", "PipelineResult"]
+__all__ = ["PaperWorkflow", "PaperPipeline", "PipelineResult", "StageCache"]
@@ -1,27 +1,64 @@
 """Orchestrator for the paper processing pipeline."""
 
 import logging
-from dataclasses import dataclass, field
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Union
 
 from .paper_workflow import PaperWorkflow
+from .stage_cache import StageCache, bytes_hash, content_hash
 from ..models.paper import Paper
 from ..models.download_result import DownloadResult
 from ..models.extraction_result import ExtractionResult
 from ..models.extracted_content import ExtractedContent
 from ..models.summary_result import SummaryResult
 from ..models.audio_result import AudioResult
-from ..services.arxiv_service import ArxivService
-from ..services.pdf_service import PdfService
-from ..services.llm_service import LLMService
-from ..services.audio_service import AudioService
+from ..services.library_index import LibraryIndex
+
+if TYPE_CHECKING:
+    # Services are passed in by the caller; importing them here would pull in
+    # PDF parsing, LLM and TTS SDKs for code that only loads paper state
+    from ..services.arxiv_service import ArxivService
+    from ..services.pdf_service import PdfService
+    from ..services.llm_service import LLMService
+    from ..services.audio_service import AudioService
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MAX_CONCURRENCY = 8  # papers processed at once by process_papers
+SUMMARY_PROMPT_NAME = "summarize_paper"
+
+
+def _find_file(directory: Path, matches: Callable[[str], bool]) -> Optional[os.DirEntry]:
+    """
+    Find the first non-hidden file in a directory whose name matches.
+
+    A single os.scandir pass covers the existence check and the name match,
+    and the returned DirEntry caches its file type and stat result.
 
-@dataclass
+    Args:
+        directory: Directory to search
+        matches: Predicate on the file name
+
+    Returns:
+        Matching DirEntry, or None if the directory or file doesn't exist
+    """
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                # Skip hidden entries such as the .cache directory
+                if not entry.name.startswith(".") and matches(entry.name) and entry.is_file():
+                    return entry
+    except (FileNotFoundError, NotADirectoryError):
+        pass
+    return None
+
+
+@dataclass(slots=True)
 class PipelineResult:
     """Complete result of processing a paper through the pipeline."""
 
@@ -52,27 +89,23 @@ class PipelineResult:
 
     def to_dict(self) -> dict:
         """Convert pipeline result to dictionary."""
+        download = extraction = None
+        if self.download:
+            download = {"pdf_path": str(self.download.pdf_path)}
+        if self.extraction:
+            extraction = {
+                "saved_path": str(self.extraction.saved_path),
+                "character_count": self.extraction.character_count,
+            }
+
         return {
             "paper_id": self.paper.arxiv_id,
             "paper_title": self.paper.title,
             "current_state": self.current_stage,
             "is_successful": self.is_successful,
             "is_failed": self.is_failed,
-            "download": {
-                "pdf_path": str(self.download.pdf_path) if self.download else None,
-            }
-            if self.download
-            else None,
-            "extraction": {
-                "saved_path": str(self.extraction.saved_path)
-                if self.extraction
-                else None,
-                "character_count": self.extraction.character_count
-                if self.extraction
-                else 0,
-            }
-            if self.extraction
-            else None,
+            "download": download,
+            "extraction": extraction,
             "summary": self.summary.to_dict() if self.summary else None,
             "audio": self.audio.to_dict() if self.audio else None,
             "errors": self.errors,
@@ -98,11 +131,13 @@ class PaperPipeline:
 
     def __init__(
         self,
-        arxiv_service: ArxivService,
-        pdf_service: PdfService,
-        llm_service: LLMService,
-        audio_service: AudioService,
+        arxiv_service: "ArxivService",
+        pdf_service: "PdfService",
+        llm_service: Union["LLMService", Callable[[], "LLMService"]],
+        audio_service: Union["AudioService", Callable[[], "AudioService"]],
         storage_dir: Path,
+        library_index: Optional[LibraryIndex] = None,
+        stage_cache: Optional[StageCache] = None,
     ):
         """
         Initialize the pipeline with required services.
@@ -110,25 +145,68 @@ class PaperPipeline:
         Args:
             arxiv_service: Service for downloading papers from arXiv
             pdf_service: Service for extracting content from PDFs
-            llm_service: Service for generating summaries
-            audio_service: Service for generating audio
+            llm_service: Service for generating summaries, or a zero-argument
+                        factory that creates it when first needed
+            audio_service: Service for generating audio, or a zero-argument
+                          factory that creates it when first needed
             storage_dir: Root directory for storing artifacts
+            library_index: Index updated whenever paper state is saved
+                          (default: index stored under storage_dir)
+            stage_cache: Cache of extract/summarize/audio results keyed by
+                        their inputs (default: StageCache())
         """
         self.arxiv = arxiv_service
         self.pdf = pdf_service
-        self.llm = llm_service
-        self.audio = audio_service
+        # Provider-backed services may be factories so that runs which stop
+        # before summarize/audio never construct API clients
+        self._llm = llm_service
+        self._audio = audio_service
+        self._service_lock = threading.Lock()
         self.storage_dir = Path(storage_dir)
 
         # Create storage directory if it doesn't exist
         self.storage_dir.mkdir(parents=True, exist_ok=True)
 
+        self.library_index = library_index or LibraryIndex(self.storage_dir)
+        self.stage_cache = stage_cache or StageCache()
+
         logger.info(f"Initialized pipeline with storage at: {self.storage_dir}")
 
+    @property
+    def llm(self) -> "LLMService":
+        """LLM service, created on first use if a factory was given."""
+        return self._resolve_service("_llm")
+
+    @property
+    def audio(self) -> "AudioService":
+        """Audio service, created on first use if a factory was given."""
+        return self._resolve_service("_audio")
+
+    def _resolve_service(self, attr: str) -> Any:
+        """
+        Return a service, calling its factory once if it has not been created.
+
+        Args:
+            attr: Attribute holding the service or its factory
+
+        Returns:
+            Service instance
+        """
+        service = getattr(self, attr)
+        if callable(service):
+            # Papers may be processed concurrently; build the service once
+            with self._service_lock:
+                service = getattr(self, attr)
+                if callable(service):
+                    service = service()
+                    setattr(self, attr, service)
+        return service
+
     def process_paper(
         self,
         paper: Paper,
         stages: Optional[List[str]] = None,
+        on_stage: Optional[Callable[[str, Any], None]] = None,
     ) -> PipelineResult:
         """
         Process a paper through the pipeline.
@@ -137,6 +215,9 @@ class PaperPipeline:
             paper: Paper object to process
             stages: List of stages to run (default: all stages)
                    Options: ["download", "extract", "summarize", "audio"]
+            on_stage: Optional progress callback, called as on_stage(stage, None)
+                   when a stage starts and on_stage(stage, stage_result) when it
+                   completes
 
         Returns:
             PipelineResult with complete results and any errors
@@ -157,30 +238,41 @@ class PaperPipeline:
         try:
             # Download stage
             if "download" in stages and workflow.can_download():
-                result.download = self._stage_download(paper, workflow)
+                self._notify(on_stage, "download", None)
+                # Keep the PDF in memory when it is extracted straight away
+                result.download = self._stage_download(
+                    paper, workflow, keep_pdf_bytes="extract" in stages
+                )
+                self._notify(on_stage, "download", result.download)
 
             # Extract stage - lazy load download result if needed
             if "extract" in stages and workflow.can_extract():
                 if not result.download:
                     result.download = self._load_download_result(paper)
                 if result.download:
+                    self._notify(on_stage, "extract", None)
                     result.extraction = self._stage_extract(paper, result.download, workflow)
+                    self._notify(on_stage, "extract", result.extraction)
 
             # Summarize stage - lazy load extraction result if needed
             if "summarize" in stages and workflow.can_summarize():
                 if not result.extraction:
                     result.extraction = self._load_extraction_result(paper)
                 if result.extraction:
+                    self._notify(on_stage, "summarize", None)
                     result.summary = self._stage_summarize(
                         paper, result.extraction, workflow
                     )
+                    self._notify(on_stage, "summarize", result.summary)
 
             # Audio stage - lazy load summary result if needed
             if "audio" in stages and workflow.can_generate_audio():
                 if not result.summary:
                     result.summary = self._load_summary_result(paper)
                 if result.summary:
+                    self._notify(on_stage, "audio", None)
                     result.audio = self._stage_audio(paper, result.summary, workflow)
+                    self._notify(on_stage, "audio", result.audio)
 
             # Finalize pipeline if audio generation is complete
             if workflow.can_finalize():
@@ -195,6 +287,14 @@ class PaperPipeline:
             logger.error(f"Pipeline failed for {paper.arxiv_id}: {e}", exc_info=True)
 
         finally:
+            # Don't hold PDF contents or full markdown in the returned result
+            if result.download and result.download.pdf_bytes is not None:
+                result.download = replace(result.download, pdf_bytes=None)
+            if result.extraction and result.extraction.content.path is None:
+                result.extraction = replace(
+                    result.extraction,
+                    content=ExtractedContent.from_file(result.extraction.saved_path),
+                )
             result.completed_at = datetime.now()
 
         logger.info(
@@ -204,8 +304,70 @@ class PaperPipeline:
 
         return result
 
+    def process_papers(
+        self,
+        papers: List[Paper],
+        stages: Optional[List[str]] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> List[PipelineResult]:
+        """
+        Process several papers concurrently.
+
+        Every stage is bound by network latency (arXiv, LLM and TTS APIs), so
+        papers are run on a bounded thread pool and their API calls overlap.
+        Each worker writes only to its own paper directory; papers that map
+        to the same directory (e.g. the same paper listed twice) are
+        processed once, since two workers would otherwise race on its files.
+
+        Args:
+            papers: Papers to process
+            stages: List of stages to run for each paper (default: all stages)
+            max_concurrency: Maximum number of papers processed at once
+
+        Returns:
+            PipelineResult for each paper, in the same order as papers
+            (duplicates share the result of their first occurrence)
+        """
+        if not papers:
+            return []
+
+        unique_papers = {}
+        for paper in papers:
+            unique_papers.setdefault(paper.cleaned_title, paper)
+
+        max_workers = min(max_concurrency, len(unique_papers))
+        logger.info(f"Processing {len(unique_papers)} papers with {max_workers} workers")
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = dict(zip(
+                unique_papers,
+                executor.map(
+                    lambda paper: self.process_paper(paper, stages=stages),
+                    unique_papers.values(),
+                ),
+            ))
+
+        return [results[paper.cleaned_title] for paper in papers]
+
+    @staticmethod
+    def _notify(
+        on_stage: Optional[Callable[[str, Any], None]],
+        stage: str,
+        stage_result: Any,
+    ) -> None:
+        """
+        Invoke the progress callback, if one was given.
+
+        Args:
+            on_stage: Progress callback passed to process_paper (may be None)
+            stage: Stage name
+            stage_result: Stage result, or None when the stage is starting
+        """
+        if on_stage:
+            on_stage(stage, stage_result)
+
     def _stage_download(
-        self, paper: Paper, workflow: PaperWorkflow
+        self, paper: Paper, workflow: PaperWorkflow, keep_pdf_bytes: bool = False
     ) -> DownloadResult:
         """
         Execute download stage.
@@ -213,6 +375,7 @@ class PaperPipeline:
         Args:
             paper: Paper to download
             workflow: State machine to update
+            keep_pdf_bytes: Keep the PDF contents in the result for extraction
 
         Returns:
             DownloadResult with paths and metadata
@@ -225,7 +388,9 @@ class PaperPipeline:
             download_dir = self.storage_dir / "papers" / paper.cleaned_title
 
             # Download paper
-            result = self.arxiv.download_paper(paper, str(download_dir))
+            result = self.arxiv.download_paper(
+                paper, str(download_dir), keep_bytes=keep_pdf_bytes
+            )
 
             workflow.complete_download()
             self._save_paper_state(paper)
@@ -259,12 +424,28 @@ class PaperPipeline:
             extract_dir = download.save_dir / "extracted"
             base_filename = Path(download.pdf_filename).stem
 
-            result = self.pdf.extract_and_save(
-                pdf_path=download.pdf_path,
-                output_dir=extract_dir,
-                base_filename=base_filename,
+            # Reuse a previous extraction of identical PDF bytes by the same
+            # converter version
+            if download.pdf_bytes is not None:
+                pdf_hash = bytes_hash(download.pdf_bytes)
+            else:
+                pdf_hash = self.stage_cache.cached_file_hash(
+                    download.save_dir, download.pdf_path
+                )
+            cache_key = content_hash(pdf_hash, self.pdf.converter_version)
+            result = self.stage_cache.load(
+                download.save_dir, "extract", cache_key, ExtractionResult.from_dict
             )
 
+            if result is None:
+                result = self.pdf.extract_and_save(
+                    pdf_path=download.pdf_path,
+                    output_dir=extract_dir,
+                    base_filename=base_filename,
+                    pdf_bytes=download.pdf_bytes,
+                )
+                self.stage_cache.save(download.save_dir, "extract", cache_key, result.to_dict())
+
             workflow.complete_extract()
             self._save_paper_state(paper)
             logger.info(
@@ -297,16 +478,25 @@ class PaperPipeline:
 
         try:
             # Summary directory
-            summary_dir = extraction.saved_path.parent.parent / "summaries"
-
-            # Generate summary using service (returns SummaryResult directly)
-            result = self.llm.summarize_paper(
-                paper=paper,
-                extracted_content=extraction.content.markdown,
-                output_dir=summary_dir,
-                prompt_name="summarize_paper",
+            paper_dir = extraction.saved_path.parent.parent
+            summary_dir = paper_dir / "summaries"
+
+            # Reuse a previous summary of identical content, prompt and model
+            cache_key = self._summary_cache_key(paper, extraction)
+            result = self.stage_cache.load(
+                paper_dir, "summarize", cache_key, SummaryResult.from_dict
             )
 
+            if result is None:
+                # Generate summary using service (returns SummaryResult directly)
+                result = self.llm.summarize_paper(
+                    paper=paper,
+                    extracted_content=extraction.content.markdown,
+                    output_dir=summary_dir,
+                    prompt_name=SUMMARY_PROMPT_NAME,
+                )
+                self.stage_cache.save(paper_dir, "summarize", cache_key, result.to_dict())
+
             logger.info(f"Summarized paper. Length of summary: {len(result.summary_text)} characters")
             workflow.complete_summarize()
             self._save_paper_state(paper)
@@ -337,20 +527,30 @@ class PaperPipeline:
 
         try:
             # Audio directory
-            audio_dir = summary.saved_path.parent.parent / "audio"
+            paper_dir = summary.saved_path.parent.parent
+            audio_dir = paper_dir / "audio"
 
             # Determine base filename
             base_filename = summary.saved_path.stem.replace("summary_", "")
 
-            # Generate audio
-            result = self.audio.generate_audio(
-                text=summary.summary_text,
-                output_dir=audio_dir,
-                base_filename=base_filename,
+            # Reuse previous audio for identical text, voice and model
+            cache_key = self._audio_cache_key(summary)
+            result = self.stage_cache.load(
+                paper_dir, "audio", cache_key, AudioResult.from_dict
             )
 
+            if result is None:
+                # Generate audio
+                result = self.audio.generate_audio(
+                    text=summary.summary_text,
+                    output_dir=audio_dir,
+                    base_filename=base_filename,
+                )
+                self.stage_cache.save(paper_dir, "audio", cache_key, result.to_dict())
+
+            # No state save here: process_paper finalizes straight after this
+            # stage and saves the completed state, so the two writes coalesce
             workflow.complete_audio_generation()
-            self._save_paper_state(paper)
             logger.info(f"[AUDIO] Completed. Saved to {result.audio_path}")
 
             return result
@@ -359,6 +559,52 @@ class PaperPipeline:
             logger.error(f"[AUDIO] Failed: {e}")
             raise
 
+    def _summary_cache_key(self, paper: Paper, extraction: ExtractionResult) -> str:
+        """
+        Build the cache key for a summary from everything that shapes it.
+
+        Args:
+            paper: Paper being summarized (its metadata is part of the prompt)
+            extraction: Extracted content being summarized
+
+        Returns:
+            Cache key string
+        """
+        from ..services.llm_service import CHUNK_PROMPT_NAME
+
+        # Hash the templates the service will actually use (it keeps them in
+        # memory), so the key cannot drift from an edited file on disk
+        try:
+            chunk_prompt = self.llm._load_prompt(CHUNK_PROMPT_NAME)
+        except FileNotFoundError:
+            chunk_prompt = ""
+        return content_hash(
+            extraction.content.markdown,
+            self.llm._load_prompt(SUMMARY_PROMPT_NAME),
+            chunk_prompt,
+            getattr(self.llm.provider, "model", type(self.llm.provider).__name__),
+            paper.title,
+            paper.authors_str,
+            paper.published.isoformat(),
+        )
+
+    def _audio_cache_key(self, summary: SummaryResult) -> str:
+        """
+        Build the cache key for audio from the text, voice and TTS model.
+
+        Args:
+            summary: Summary being converted to speech
+
+        Returns:
+            Cache key string
+        """
+        provider = self.audio.provider
+        return content_hash(
+            summary.summary_text,
+            getattr(provider, "model", type(provider).__name__),
+            getattr(provider, "voice", "") or "",
+        )
+
     def resume_paper(self, paper: Paper) -> PipelineResult:
         """
         Resume processing a paper from its current state.
@@ -416,21 +662,16 @@ class PaperPipeline:
         """
         download_dir = self.storage_dir / "papers" / paper.cleaned_title
 
-        if not download_dir.exists():
-            return None
-
         # Find PDF file in the paper's directory
-        pdf_files = list(download_dir.glob("*.pdf"))
-
-        if pdf_files:
-            pdf_path = pdf_files[0]
+        pdf_entry = _find_file(download_dir, lambda name: name.endswith(".pdf"))
 
+        if pdf_entry:
             logger.info(f"Loading existing download result for {paper.arxiv_id}")
             return DownloadResult(
-                pdf_path=pdf_path,
+                pdf_path=Path(pdf_entry.path),
                 save_dir=download_dir,
-                pdf_filename=pdf_path.name,
-                downloaded_at=datetime.fromtimestamp(pdf_path.stat().st_mtime),
+                pdf_filename=pdf_entry.name,
+                downloaded_at=datetime.fromtimestamp(pdf_entry.stat().st_mtime),
             )
 
         return None
@@ -448,23 +689,19 @@ class PaperPipeline:
         download_dir = self.storage_dir / "papers" / paper.cleaned_title
         extract_dir = download_dir / "extracted"
 
-        if not extract_dir.exists():
-            return None
-
-        # Find markdown files in the extracted directory
-        md_files = list(extract_dir.glob("*.md"))
+        # Find markdown file in the extracted directory
+        md_entry = _find_file(extract_dir, lambda name: name.endswith(".md"))
 
-        if md_files:
-            markdown_path = md_files[0]
+        if md_entry:
+            markdown_path = Path(md_entry.path)
             logger.info(f"Loading existing extraction result for {paper.arxiv_id}")
-            # Read the markdown content from disk
-            markdown_content = markdown_path.read_text(encoding="utf-8")
 
+            # Content is read from disk when needed; character_count is
+            # computed from it on construction
             return ExtractionResult(
-                content=ExtractedContent(markdown=markdown_content),
+                content=ExtractedContent.from_file(markdown_path),
                 saved_path=markdown_path,
-                extracted_at=datetime.fromtimestamp(markdown_path.stat().st_mtime),
-                character_count=len(markdown_content),
+                extracted_at=datetime.fromtimestamp(md_entry.stat().st_mtime),
             )
 
         return None
@@ -482,14 +719,13 @@ class PaperPipeline:
         download_dir = self.storage_dir / "papers" / paper.cleaned_title
         summary_dir = download_dir / "summaries"
 
-        if not summary_dir.exists():
-            return None
-
-        # Find summary text files
-        summary_files = list(summary_dir.glob("summary_*.txt"))
+        # Find summary text file
+        summary_entry = _find_file(
+            summary_dir, lambda name: name.startswith("summary_") and name.endswith(".txt")
+        )
 
-        if summary_files:
-            summary_path = summary_files[0]
+        if summary_entry:
+            summary_path = Path(summary_entry.path)
             logger.info(f"Loading existing summary result for {paper.arxiv_id}")
             # Read the summary content from disk
             summary_content = summary_path.read_text(encoding="utf-8")
@@ -497,7 +733,7 @@ class PaperPipeline:
             return SummaryResult(
                 summary_text=summary_content,
                 saved_path=summary_path,
-                summarized_at=datetime.fromtimestamp(summary_path.stat().st_mtime),
+                summarized_at=datetime.fromtimestamp(summary_entry.stat().st_mtime),
             )
 
         return None
@@ -515,19 +751,16 @@ class PaperPipeline:
         download_dir = self.storage_dir / "papers" / paper.cleaned_title
         audio_dir = download_dir / "audio"
 
-        if not audio_dir.exists():
-            return None
+        # Find audio file (mp3)
+        audio_entry = _find_file(audio_dir, lambda name: name.endswith(".mp3"))
 
-        # Find audio files (mp3)
-        audio_files = list(audio_dir.glob("*.mp3"))
-
-        if audio_files:
-            audio_path = audio_files[0]
+        if audio_entry:
+            audio_path = Path(audio_entry.path)
             logger.info(f"Loading existing audio result for {paper.arxiv_id}")
 
             return AudioResult(
                 audio_path=audio_path,
-                generated_at=datetime.fromtimestamp(audio_path.stat().st_mtime),
+                generated_at=datetime.fromtimestamp(audio_entry.stat().st_mtime),
             )
 
         return None
@@ -536,11 +769,14 @@ class PaperPipeline:
         """
         Save paper state to disk for persistence across runs.
 
+        Also refreshes the paper's entry in the library index.
+
         Args:
             paper: Paper to save
         """
         try:
             state_file = paper.save_to_disk(self.storage_dir)
+            self.library_index.upsert(paper)
             logger.debug(f"Saved paper state to {state_file}")
         except Exception as e:
             logger.warning(f"Failed to save paper state: {e}")
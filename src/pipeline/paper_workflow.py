@@ -7,6 +7,17 @@ from statemachine import StateMachine, State
 
 logger = logging.getLogger(__name__)
 
+# Lookup tables keyed by state id
+_NEXT_ACTIONS = {
+    "new": "download",
+    "downloaded": "extract",
+    "extracted": "summarize",
+    "summarized": "generate_audio",
+    "audio_generated": "finalize",
+}
+_PROCESSING_STATES = frozenset({"downloading", "extracting", "summarizing", "generating_audio"})
+_TERMINAL_STATES = frozenset({"completed", "failed"})
+
 
 class PaperWorkflow(StateMachine):
     """
@@ -51,17 +62,7 @@ class PaperWorkflow(StateMachine):
     finalize = audio_generated.to(completed)
 
     # Failure transitions from any non-terminal state
-    mark_failed = (
-        new.to(failed)
-        | downloading.to(failed)
-        | downloaded.to(failed)
-        | extracting.to(failed)
-        | extracted.to(failed)
-        | summarizing.to(failed)
-        | summarized.to(failed)
-        | generating_audio.to(failed)
-        | audio_generated.to(failed)
-    )
+    mark_failed = failed.from_.any()
 
     def __init__(self, model=None, state_field="status", start_value=None):
         """
@@ -73,10 +74,12 @@ class PaperWorkflow(StateMachine):
             start_value: Initial state value (optional, uses model's current state if provided)
         """
         self.model = model
+        # The paper id doesn't change during processing; resolve it once for logging
+        self._paper_id = getattr(model, "arxiv_id", "unknown")
 
         # If model provided and has a status, start from that state
-        if model and hasattr(model, state_field):
-            start_value = getattr(model, state_field)
+        if model is not None:
+            start_value = getattr(model, state_field, start_value)
 
         super().__init__(model=model, state_field=state_field, start_value=start_value)
 
@@ -84,39 +87,39 @@ class PaperWorkflow(StateMachine):
 
     def on_enter_downloading(self):
         """Called when entering downloading state."""
-        logger.info(f"Starting download for paper: {self._get_paper_id()}")
+        logger.info("Starting download for paper: %s", self._paper_id)
 
     def on_enter_downloaded(self):
         """Called when download completes."""
-        logger.info(f"Download completed for paper: {self._get_paper_id()}")
+        logger.info("Download completed for paper: %s", self._paper_id)
 
     def on_enter_extracting(self):
         """Called when starting PDF extraction."""
-        logger.info(f"Starting extraction for paper: {self._get_paper_id()}")
+        logger.info("Starting extraction for paper: %s", self._paper_id)
 
     def on_enter_extracted(self):
         """Called when extraction completes."""
-        logger.info(f"Extraction completed for paper: {self._get_paper_id()}")
+        logger.info("Extraction completed for paper: %s", self._paper_id)
 
     def on_enter_summarizing(self):
         """Called when starting summarization."""
-        logger.info(f"Starting summarization for paper: {self._get_paper_id()}")
+        logger.info("Starting summarization for paper: %s", self._paper_id)
 
     def on_enter_summarized(self):
         """Called when summarization completes."""
-        logger.info(f"Summarization completed for paper: {self._get_paper_id()}")
+        logger.info("Summarization completed for paper: %s", self._paper_id)
 
     def on_enter_generating_audio(self):
         """Called when starting audio generation."""
-        logger.info(f"Starting audio generation for paper: {self._get_paper_id()}")
+        logger.info("Starting audio generation for paper: %s", self._paper_id)
 
     def on_enter_audio_generated(self):
         """Called when audio generation completes."""
-        logger.info(f"Audio generation completed for paper: {self._get_paper_id()}")
+        logger.info("Audio generation completed for paper: %s", self._paper_id)
 
     def on_enter_completed(self):
         """Called when entire pipeline completes."""
-        logger.info(f"Pipeline completed for paper: {self._get_paper_id()}")
+        logger.info("Pipeline completed for paper: %s", self._paper_id)
 
     def on_enter_failed(self, error: Optional[str] = None):
         """
@@ -125,19 +128,16 @@ class PaperWorkflow(StateMachine):
         Args:
             error: Optional error message
         """
-        paper_id = self._get_paper_id()
         if error:
-            logger.error(f"Pipeline failed for paper {paper_id}: {error}")
+            logger.error("Pipeline failed for paper %s: %s", self._paper_id, error)
         else:
-            logger.error(f"Pipeline failed for paper {paper_id}")
+            logger.error("Pipeline failed for paper %s", self._paper_id)
 
     # Helper methods
 
     def _get_paper_id(self) -> str:
         """Get paper identifier for logging."""
-        if self.model and hasattr(self.model, "arxiv_id"):
-            return self.model.arxiv_id
-        return "unknown"
+        return self._paper_id
 
     def can_download(self) -> bool:
         """Check if paper can be downloaded."""
@@ -149,7 +149,6 @@ class PaperWorkflow(StateMachine):
 
     def can_summarize(self) -> bool:
         """Check if paper can be summarized."""
-        logger.info(f"can_summarize: {self.current_state == self.extracted}")
         return self.current_state == self.extracted
 
     def can_generate_audio(self) -> bool:
@@ -162,16 +161,11 @@ class PaperWorkflow(StateMachine):
 
     def is_processing(self) -> bool:
         """Check if paper is currently being processed."""
-        return self.current_state in [
-            self.downloading,
-            self.extracting,
-            self.summarizing,
-            self.generating_audio,
-        ]
+        return self.current_state.id in _PROCESSING_STATES
 
     def is_terminal(self) -> bool:
         """Check if in a terminal state (completed or failed)."""
-        return self.current_state in [self.completed, self.failed]
+        return self.current_state.id in _TERMINAL_STATES
 
     def get_next_action(self) -> Optional[str]:
         """
@@ -180,20 +174,5 @@ class PaperWorkflow(StateMachine):
         Returns:
             String describing next action, or None if terminal/processing
         """
-        if self.is_processing():
-            return None  # Already processing
-
-        if self.current_state == self.new:
-            return "download"
-        elif self.current_state == self.downloaded:
-            return "extract"
-        elif self.current_state == self.extracted:
-            return "summarize"
-        elif self.current_state == self.summarized:
-            return "generate_audio"
-        elif self.current_state == self.audio_generated:
-            return "finalize"
-        elif self.is_terminal():
-            return None
-
-        return None
+        # Processing and terminal states have no entry
+        return _NEXT_ACTIONS.get(self.current_state.id)
@@ -0,0 +1,203 @@
+"""Content-addressed cache for pipeline stage results."""
+
+import hashlib
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Callable, Optional, TypeVar
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+CACHE_DIRNAME = ".cache"
+FILE_HASHES_FILENAME = "file_hashes.json"
+FILE_HASH_CHUNK_SIZE = 1024 * 1024  # bytes
+
+
+def content_hash(*parts: str | bytes) -> str:
+    """
+    Hash several inputs into a single cache key.
+
+    Args:
+        parts: Strings or bytes that determine a stage's output
+
+    Returns:
+        Hex digest identifying the combination of inputs
+    """
+    digest = hashlib.blake2b(digest_size=32)
+    for part in parts:
+        if isinstance(part, str):
+            part = part.encode("utf-8")
+        # Length prefix keeps ("ab", "c") and ("a", "bc") distinct
+        digest.update(len(part).to_bytes(8, "little"))
+        digest.update(part)
+    return digest.hexdigest()
+
+
+def file_hash(path: str | Path) -> str:
+    """
+    Compute the SHA-256 digest of a file's contents.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        Hex digest of the file contents
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(FILE_HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def bytes_hash(data: bytes) -> str:
+    """
+    Compute the SHA-256 digest of in-memory data.
+
+    Matches file_hash() for a file with the same contents.
+
+    Args:
+        data: Data to hash
+
+    Returns:
+        Hex digest of the data
+    """
+    return hashlib.sha256(data).hexdigest()
+
+
+def _replace_file(path: Path, data: bytes) -> None:
+    """Write data to a temporary file and atomically rename it over path."""
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+class StageCache:
+    """
+    Cache of stage results keyed by a hash of the stage inputs.
+
+    Each paper keeps one entry per stage under
+    data/papers/<paper>/.cache/<stage>.json. An entry is only reused when its
+    key matches the current inputs and every *_path it references still
+    exists, so re-running a paper with unchanged inputs reads results from
+    disk instead of calling the extraction, LLM or TTS services again.
+    """
+
+    def load(
+        self,
+        paper_dir: Path,
+        stage: str,
+        key: str,
+        from_dict: Callable[[dict], T],
+    ) -> Optional[T]:
+        """
+        Load a cached stage result if it matches the given key.
+
+        Args:
+            paper_dir: Paper directory
+            stage: Stage name (e.g., "summarize")
+            key: Cache key for the current stage inputs
+            from_dict: Deserializer for the stage result
+
+        Returns:
+            Cached result, or None on a miss
+        """
+        cache_file = Path(paper_dir) / CACHE_DIRNAME / f"{stage}.json"
+
+        if not cache_file.exists():
+            return None
+
+        try:
+            entry = orjson.loads(cache_file.read_bytes())
+
+            if entry.get("key") != key:
+                return None
+
+            data = entry["result"]
+            for name, value in data.items():
+                if name.endswith("_path") and value and not Path(value).exists():
+                    return None
+
+            logger.info(f"[{stage.upper()}] Cache hit in {paper_dir}")
+            return from_dict(data)
+
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cache entry {cache_file}: {e}")
+            return None
+
+    def save(self, paper_dir: Path, stage: str, key: str, result: dict) -> None:
+        """
+        Store a stage result under the given key.
+
+        Args:
+            paper_dir: Paper directory
+            stage: Stage name (e.g., "summarize")
+            key: Cache key for the stage inputs
+            result: Serialized stage result (from its to_dict())
+        """
+        cache_dir = Path(paper_dir) / CACHE_DIRNAME
+
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            _replace_file(
+                cache_dir / f"{stage}.json",
+                orjson.dumps({"key": key, "result": result}),
+            )
+        except Exception as e:
+            logger.warning(f"Failed to write cache entry for {stage}: {e}")
+
+    def cached_file_hash(self, paper_dir: Path, path: str | Path) -> str:
+        """
+        Compute file_hash() of a file, reusing the stored digest if unchanged.
+
+        The digest is recorded under the paper's cache directory together
+        with the file's size and modification time. While both still match,
+        the stored digest is returned after a single stat() instead of
+        reading and hashing the whole file again.
+
+        Args:
+            paper_dir: Paper directory
+            path: File to hash
+
+        Returns:
+            Hex digest of the file contents
+        """
+        path = Path(path)
+        stat = path.stat()
+        records_file = Path(paper_dir) / CACHE_DIRNAME / FILE_HASHES_FILENAME
+
+        try:
+            records = orjson.loads(records_file.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            records = {}
+
+        record = records.get(path.name)
+        if (
+            record
+            and record.get("mtime_ns") == stat.st_mtime_ns
+            and record.get("size") == stat.st_size
+        ):
+            return record["sha256"]
+
+        digest = file_hash(path)
+        records[path.name] = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": digest,
+        }
+
+        try:
+            records_file.parent.mkdir(parents=True, exist_ok=True)
+            _replace_file(records_file, orjson.dumps(records))
+        except Exception as e:
+            logger.warning(f"Failed to record hash of {path}: {e}")
+
+        return digest
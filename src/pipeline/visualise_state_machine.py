@@ -1,13 +1,40 @@
-from .paper_workflow import PaperWorkflow
-from statemachine.contrib.diagram import DotGraphMachine
+"""
+Render the PaperWorkflow state machine diagram.
+
+Run as a module to regenerate the asset:
+    python -m src.pipeline.visualise_state_machine
+"""
+
 from pathlib import Path
 
+from .paper_workflow import PaperWorkflow
+
 asset_dir = Path("assets")
-asset_dir.mkdir(exist_ok=True)
+image_filename = "state_machine_visualisation.png"
+
+
+def render(path: Path = asset_dir / image_filename) -> Path:
+    """
+    Render the workflow diagram to a PNG file.
+
+    Args:
+        path: Output image path
+
+    Returns:
+        Path to the written image
+    """
+    # Graphviz support is only needed when rendering
+    from statemachine.contrib.diagram import DotGraphMachine
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    machine = PaperWorkflow()
+    dot = DotGraphMachine(machine)()
+    dot.write_png(str(path))
+
+    return path
 
-audio_filename = "state_machine_visualisation.png"
-audio_path = asset_dir / audio_filename
 
-machine = PaperWorkflow()
-dot = DotGraphMachine(machine)() 
-dot.write_png(str(audio_path))
\ No newline at end of file
+if __name__ == "__main__":
+    render()
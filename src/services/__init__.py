@@ -1,11 +1,32 @@
 """Services package for Paper Podcasts application."""
 
-from .arxiv_service import ArxivService
-from .pdf_service import PdfService
-from .llm_service import LLMService
-from .llm_providers import LLMProvider, AnthropicProvider
-from .tts_providers import TTSProvider, OpenAITTSProvider
-from .audio_service import AudioService
+import importlib
+from typing import TYPE_CHECKING
+
+# Services are imported on first attribute access, so importing one light
+# module (e.g. library_index) doesn't load the PDF, LLM and TTS SDKs
+_EXPORTS = {
+    "ArxivService": ".arxiv_service",
+    "PdfService": ".pdf_service",
+    "LLMService": ".llm_service",
+    "LLMProvider": ".llm_providers",
+    "AnthropicProvider": ".llm_providers",
+    "TTSProvider": ".tts_providers",
+    "OpenAITTSProvider": ".tts_providers",
+    "AudioService": ".audio_service",
+    "LibraryIndex": ".library_index",
+    "RateLimiter": ".rate_limiter",
+}
+
+if TYPE_CHECKING:
+    from .arxiv_service import ArxivService
+    from .pdf_service import PdfService
+    from .llm_service import LLMService
+    from .llm_providers import LLMProvider, AnthropicProvider
+    from .tts_providers import TTSProvider, OpenAITTSProvider
+    from .audio_service import AudioService
+    from .library_index import LibraryIndex
+    from .rate_limiter import RateLimiter
 
 __all__ = [
     "ArxivService",
@@ -16,4 +37,15 @@ __all__ = [
     "TTSProvider",
     "OpenAITTSProvider",
     "AudioService",
+    "LibraryIndex",
+    "RateLimiter",
 ]
+
+
+def __getattr__(name: str):
+    """Import an exported service on first access."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -1,18 +1,89 @@
 """Service for interacting with the arXiv API."""
 
-import json
+import os
 import time
 import logging
-from datetime import datetime
+import threading
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timezone
 from pathlib import Path
-from typing import List
+from typing import BinaryIO, Iterator, List, Optional, Tuple
 import arxiv
+import requests
 from ..models.paper import Paper, Author
 from ..models.download_result import DownloadResult
 
 
 logger = logging.getLogger(__name__)
 
+PDF_DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # bytes
+PDF_DOWNLOAD_TIMEOUT = 60  # seconds
+MAX_CONCURRENT_DOWNLOADS = 4
+
+# OAI-PMH bulk metadata harvesting
+OAI_PMH_URL = "https://export.arxiv.org/oai2"
+OAI_PMH_TIMEOUT = 120  # seconds
+OAI_PMH_MAX_RETRIES = 5
+_OAI_NS = "{http://www.openarchives.org/OAI/2.0/}"
+_ARXIV_NS = "{http://arxiv.org/OAI/arXiv/}"
+
+# Archives whose OAI-PMH sets live under the physics group ("physics:<archive>")
+_PHYSICS_ARCHIVES = frozenset({
+    "astro-ph", "cond-mat", "gr-qc", "hep-ex", "hep-lat", "hep-ph", "hep-th",
+    "math-ph", "nlin", "nucl-ex", "nucl-th", "physics", "quant-ph",
+})
+
+# One arXiv API client for all service instances, so its HTTP session and
+# keep-alive connections are reused across searches and PDF URL lookups.
+# The client waits delay_seconds after the previous request made through it,
+# whichever call or thread made it, and tracks that time in unsynchronised
+# state; every use of the client therefore holds _SHARED_CLIENT_LOCK.
+_SHARED_CLIENT = arxiv.Client(page_size=100, num_retries=3)
+_SHARED_CLIENT_LOCK = threading.Lock()
+
+
+def _open_for_write(path: Path) -> BinaryIO:
+    """
+    Open a file for binary writing, creating its directory only if missing.
+
+    Directories usually exist already (re-downloads, pipeline-created paper
+    directories), so this skips the mkdir() stat/mkdir syscalls on the
+    common path instead of running them before every write.
+
+    Args:
+        path: File to open
+
+    Returns:
+        File object opened in "wb" mode
+    """
+    try:
+        return open(path, "wb")
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return open(path, "wb")
+
+
+def _oai_set_spec(category: str) -> Tuple[str, Optional[str]]:
+    """
+    Map an arXiv archive or category to its OAI-PMH set.
+
+    Args:
+        category: Archive (e.g., "cs", "hep-th", "physics:hep-th") or
+                 category (e.g., "cs.AI", "cond-mat.str-el")
+
+    Returns:
+        Tuple of (set_spec, category to filter records by, or None to keep
+        every record in the set)
+    """
+    category = category.removeprefix("physics:")
+    archive = category.partition(".")[0]
+    wanted_category = category if archive != category else None
+
+    if archive in _PHYSICS_ARCHIVES:
+        return f"physics:{archive}", wanted_category
+    return archive, wanted_category
+
 
 class ArxivService:
     """Service for searching and downloading papers from arXiv."""
@@ -25,21 +96,32 @@ class ArxivService:
             rate_limit_delay: Delay in seconds between API requests (arXiv recommends 3 seconds)
         """
         self.rate_limit_delay = rate_limit_delay
-        self.last_request_time = 0.0
-        self.client = arxiv.Client()
+        self._next_request_time = 0.0  # time.monotonic() value of the next free slot
+        self._rate_limit_lock = threading.Lock()
+        self.client = _SHARED_CLIENT
+        self._client_lock = _SHARED_CLIENT_LOCK
+        # Shared session so PDF downloads reuse pooled keep-alive connections
+        self.session = requests.Session()
 
     def _rate_limit(self):
-        """Enforce rate limiting between API requests."""
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
-
-        if time_since_last_request < self.rate_limit_delay:
-            sleep_time = self.rate_limit_delay - time_since_last_request
+        """Enforce rate limiting between API requests (safe across threads)."""
+        if self.rate_limit_delay <= 0:
+            return
+
+        # Reserve the next free slot under the lock, then sleep outside it so
+        # concurrent callers queue up for successive slots without blocking
+        # each other on the lock. The monotonic clock is immune to wall-clock
+        # adjustments.
+        with self._rate_limit_lock:
+            now = time.monotonic()
+            slot = max(now, self._next_request_time)
+            self._next_request_time = slot + self.rate_limit_delay
+
+        sleep_time = slot - now
+        if sleep_time > 0:
             logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
             time.sleep(sleep_time)
 
-        self.last_request_time = time.time()
-
     def _arxiv_result_to_paper(self, result: arxiv.Result) -> Paper:
         """
         Convert an arxiv.Result object to our Paper model.
@@ -86,6 +168,32 @@ class ArxivService:
         Returns:
             List of Paper objects
         """
+        papers = list(self.iter_search_by_topic(topic, exact=exact, max_results=max_results))
+        logger.info(f"Found {len(papers)} papers")
+        return papers
+
+    def iter_search_by_topic(
+        self,
+        topic: str,
+        exact: bool = True,
+        max_results: int = 10,
+    ) -> Iterator[Paper]:
+        """
+        Search for papers on a specific topic, yielding them as they arrive.
+
+        Like search_by_topic(), but lazy: callers that stop early (e.g., after
+        the first few unprocessed papers) never build the full result list,
+        and later result pages are not requested at all.
+
+        Args:
+            topic: The search topic (keywords, categories, etc.)
+            exact: If True, search for exact phrase and sort by relevance;
+                   If False, search broadly and sort by submission date
+            max_results: Maximum number of results to return
+
+        Yields:
+            Paper objects in result order
+        """
         logger.info(f"Searching for papers on topic: '{topic}'")
 
         if exact:
@@ -102,25 +210,28 @@ class ArxivService:
         )
 
         self._rate_limit()
-        papers = []
-        
+
         try:
-            for result in self.client.results(search):
+            results = self.client.results(search)
+            while True:
+                # Held per result (a page fetch at most), never across yield
+                with self._client_lock:
+                    result = next(results, None)
+                if result is None:
+                    break
                 paper = self._arxiv_result_to_paper(result)
-                papers.append(paper)
                 logger.debug(f"Found paper: {paper.title[:50]}... ({paper.arxiv_id})")
+                yield paper
 
         except Exception as e:
             logger.error(f"Error searching arXiv: {e}")
             raise
 
-        logger.info(f"Found {len(papers)} papers")
-        return papers
-
     def download_paper(
         self,
         paper: Paper,
         destination_dir: str = "downloads",
+        keep_bytes: bool = False,
     ) -> DownloadResult:
         """
         Download PDF for a paper.
@@ -137,6 +248,8 @@ class ArxivService:
         Args:
             paper: Paper object to download
             destination_dir: Directory where PDF should be saved
+            keep_bytes: Also return the PDF contents in DownloadResult.pdf_bytes,
+                       so a following extraction does not re-read the file
 
         Returns:
             DownloadResult with paths and metadata about the download
@@ -145,7 +258,6 @@ class ArxivService:
             Exception: If PDF download fails
         """
         destination_path = Path(destination_dir)
-        destination_path.mkdir(parents=True, exist_ok=True)
 
         # Create filename from cleaned paper title
         pdf_filename = f"{paper.cleaned_title}.pdf"
@@ -155,17 +267,34 @@ class ArxivService:
         self._rate_limit()
 
         try:
-            # Search for the paper to get the arxiv.Result object
-            search = arxiv.Search(id_list=[paper.arxiv_id])
-            result = next(self.client.results(search))
-
-            # Download using arxiv library's download_pdf method
-            output_path = result.download_pdf(
-                dirpath=str(destination_path),
-                filename=pdf_filename
-            )
+            # Papers from search results and saved state already carry their
+            # PDF URL; only look it up when it is missing
+            pdf_url = paper.pdf_url
+            if not pdf_url:
+                search = arxiv.Search(id_list=[paper.arxiv_id])
+                with self._client_lock:
+                    pdf_url = next(self.client.results(search)).pdf_url
+
+            # Stream the PDF through the pooled session into a partial file,
+            # then rename it so an interrupted download never leaves a
+            # truncated *.pdf that later stages would pick up
+            pdf_path = destination_path / pdf_filename
+            partial_path = pdf_path.with_suffix(".pdf.part")
+            chunks = []
+            try:
+                with self.session.get(
+                    pdf_url, stream=True, timeout=PDF_DOWNLOAD_TIMEOUT
+                ) as response:
+                    response.raise_for_status()
+                    with _open_for_write(partial_path) as f:
+                        for chunk in response.iter_content(chunk_size=PDF_DOWNLOAD_CHUNK_SIZE):
+                            f.write(chunk)
+                            if keep_bytes:
+                                chunks.append(chunk)
+                os.replace(partial_path, pdf_path)
+            finally:
+                partial_path.unlink(missing_ok=True)
 
-            pdf_path = Path(output_path)
             downloaded_at = datetime.now()
 
             logger.info(f"Successfully downloaded PDF to {pdf_path}")
@@ -175,8 +304,196 @@ class ArxivService:
                 save_dir=destination_path,
                 pdf_filename=pdf_filename,
                 downloaded_at=downloaded_at,
+                pdf_bytes=b"".join(chunks) if keep_bytes else None,
             )
 
         except Exception as e:
             logger.error(f"Failed to download PDF for {paper.arxiv_id}: {e}")
             raise
+
+    def download_papers(
+        self,
+        papers: List[Paper],
+        destination_dir: str = "downloads",
+        max_concurrency: int = MAX_CONCURRENT_DOWNLOADS,
+    ) -> List[DownloadResult]:
+        """
+        Download PDFs for several papers concurrently.
+
+        Request starts are still spaced by the shared rate limit, but each
+        transfer runs on its own thread, so slow downloads overlap instead of
+        queueing behind one another.
+
+        Args:
+            papers: Papers to download
+            destination_dir: Directory where PDFs should be saved
+            max_concurrency: Maximum number of downloads in flight
+
+        Returns:
+            DownloadResult for each paper, in the same order as papers
+
+        Raises:
+            Exception: If any PDF download fails
+        """
+        if not papers:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(papers))) as executor:
+            return list(
+                executor.map(lambda paper: self.download_paper(paper, destination_dir), papers)
+            )
+
+    def list_by_category(
+        self,
+        category: str,
+        from_date: Optional[date] = None,
+        until_date: Optional[date] = None,
+    ) -> Iterator[Paper]:
+        """
+        Harvest paper metadata for a whole category through OAI-PMH.
+
+        Intended for bulk loading: each ListRecords response carries hundreds
+        of records, instead of one rate-limited API query per page of search
+        results. Responses are stream-parsed and papers are yielded as they
+        arrive, following resumption tokens until the listing is exhausted.
+
+        Args:
+            category: Archive (e.g., "cs", "hep-th", "physics:hep-th") or
+                     category (e.g., "cs.AI", "astro-ph.CO"). Categories are
+                     harvested from their archive's set and filtered by
+                     category; physics archives use "physics:<archive>" sets.
+            from_date: Only include records updated on or after this date
+            until_date: Only include records updated on or before this date
+
+        Yields:
+            Paper objects
+        """
+        set_spec, wanted_category = _oai_set_spec(category)
+
+        params = {"verb": "ListRecords", "metadataPrefix": "arXiv", "set": set_spec}
+        if from_date:
+            params["from"] = from_date.isoformat()
+        if until_date:
+            params["until"] = until_date.isoformat()
+
+        logger.info(f"Harvesting arXiv metadata for '{category}' via OAI-PMH")
+        count = 0
+
+        while True:
+            resumption_token = None
+
+            with self._oai_request(params) as response:
+                response.raw.decode_content = True
+                for _, elem in ET.iterparse(response.raw):
+                    if elem.tag == f"{_OAI_NS}record":
+                        paper = self._oai_record_to_paper(elem)
+                        # Free the parsed record so memory stays flat
+                        elem.clear()
+                        if paper and (
+                            wanted_category is None or wanted_category in paper.categories
+                        ):
+                            count += 1
+                            yield paper
+                    elif elem.tag == f"{_OAI_NS}resumptionToken":
+                        resumption_token = (elem.text or "").strip() or None
+                    elif elem.tag == f"{_OAI_NS}error":
+                        if elem.get("code") == "noRecordsMatch":
+                            break
+                        raise RuntimeError(
+                            f"OAI-PMH error {elem.get('code')}: {(elem.text or '').strip()}"
+                        )
+
+            if not resumption_token:
+                break
+            params = {"verb": "ListRecords", "resumptionToken": resumption_token}
+
+        logger.info(f"Harvested {count} papers for '{category}'")
+
+    def _oai_request(self, params: dict) -> requests.Response:
+        """
+        Issue a streaming OAI-PMH request, honouring 503 Retry-After replies.
+
+        Args:
+            params: Query parameters for the request
+
+        Returns:
+            Streaming response with a successful status
+        """
+        for _ in range(OAI_PMH_MAX_RETRIES):
+            self._rate_limit()
+            response = self.session.get(
+                OAI_PMH_URL, params=params, stream=True, timeout=OAI_PMH_TIMEOUT
+            )
+            if response.status_code != 503:
+                response.raise_for_status()
+                return response
+
+            # arXiv uses 503 + Retry-After for OAI-PMH flow control
+            retry_after = response.headers.get("Retry-After", "")
+            response.close()
+            delay = int(retry_after) if retry_after.isdigit() else self.rate_limit_delay
+            logger.info(f"OAI-PMH asked to retry after {delay} seconds")
+            time.sleep(delay)
+
+        raise RuntimeError(f"OAI-PMH request failed after {OAI_PMH_MAX_RETRIES} retries")
+
+    @staticmethod
+    def _oai_record_to_paper(record: ET.Element) -> Optional[Paper]:
+        """
+        Convert an OAI-PMH record in arXiv metadata format to our Paper model.
+
+        Args:
+            record: <record> element from a ListRecords response
+
+        Returns:
+            Paper object, or None for deleted records
+        """
+        header = record.find(f"{_OAI_NS}header")
+        if header is not None and header.get("status") == "deleted":
+            return None
+
+        metadata = record.find(f"{_OAI_NS}metadata/{_ARXIV_NS}arXiv")
+        if metadata is None:
+            return None
+
+        def text(tag: str) -> Optional[str]:
+            value = metadata.findtext(f"{_ARXIV_NS}{tag}")
+            # Titles and abstracts are hard-wrapped in the metadata
+            return " ".join(value.split()) if value else None
+
+        def parse_date(value: Optional[str]) -> Optional[datetime]:
+            if not value:
+                return None
+            return datetime.fromisoformat(value).replace(tzinfo=timezone.utc)
+
+        authors = []
+        for author in metadata.iterfind(f"{_ARXIV_NS}authors/{_ARXIV_NS}author"):
+            name = " ".join(
+                part for part in (
+                    author.findtext(f"{_ARXIV_NS}forenames"),
+                    author.findtext(f"{_ARXIV_NS}keyname"),
+                    author.findtext(f"{_ARXIV_NS}suffix"),
+                ) if part
+            )
+            authors.append(
+                Author(name=name, affiliation=author.findtext(f"{_ARXIV_NS}affiliation"))
+            )
+
+        arxiv_id = text("id")
+        categories = (text("categories") or "").split()
+        published = parse_date(text("created"))
+
+        return Paper(
+            arxiv_id=arxiv_id,
+            title=text("title") or "",
+            authors=authors,
+            abstract=text("abstract") or "",
+            published=published,
+            updated=parse_date(text("updated")) or published,
+            categories=categories,
+            primary_category=categories[0] if categories else "",
+            pdf_url=f"https://arxiv.org/pdf/{arxiv_id}",
+            comment=text("comments"),
+            journal_ref=text("journal-ref"),
+            doi=text("doi"),
+        )
@@ -1,16 +1,31 @@
 """Service for generating audio from text."""
 
 import logging
+import os
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 from .tts_providers import TTSProvider
 from ..models.audio_result import AudioResult
 
 logger = logging.getLogger(__name__)
 
+MAX_TTS_INPUT_CHARS = 4096  # OpenAI TTS input limit per request
+MAX_CONCURRENT_TTS_REQUESTS = 8  # in flight per AudioService, across all papers
+
+# Markup stripped by clean_text_for_tts. Tags are removed before headers so
+# that markers wrapped in tags (e.g. "<b>#</b> Title") are stripped too.
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_MARKDOWN_HEADER_RE = re.compile(r'^#{1,6}\s+', re.MULTILINE)
+
+# Boundaries used by split_text_for_tts
+_PARAGRAPH_BREAK_RE = re.compile(r'\n\s*\n')
+_SENTENCE_BREAK_RE = re.compile(r'(?<=[.!?])\s+')
+
 
 def clean_text_for_tts(text: str) -> str:
     """
@@ -20,25 +35,83 @@ def clean_text_for_tts(text: str) -> str:
     Returns:
         Clean text suitable for text-to-speech
     """
+    # Most summaries are plain prose with nothing to strip
+    if '<' not in text and '#' not in text:
+        return text
     # Remove HTML tags
-    text = re.sub(r'<[^>]+>', '', text)
+    text = _HTML_TAG_RE.sub('', text)
     # Remove markdown headers (# ## ### etc.)
-    text = re.sub(r'^#{1,6}\s+', '', text, flags=re.MULTILINE)
-    return text
+    return _MARKDOWN_HEADER_RE.sub('', text)
+
+
+def split_text_for_tts(text: str, max_chars: int = MAX_TTS_INPUT_CHARS) -> List[str]:
+    """
+    Split text into chunks that fit within a single TTS request.
+
+    Splits on paragraph boundaries where possible, then on sentence
+    boundaries, and only hard-splits sentences longer than max_chars.
+
+    Args:
+        text: Text to split
+        max_chars: Maximum characters per chunk
+
+    Returns:
+        List of non-empty chunks, in order
+    """
+    pieces = []
+    for paragraph in _PARAGRAPH_BREAK_RE.split(text):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        if len(paragraph) <= max_chars:
+            pieces.append(paragraph)
+            continue
+        for sentence in _SENTENCE_BREAK_RE.split(paragraph):
+            while len(sentence) > max_chars:
+                pieces.append(sentence[:max_chars])
+                sentence = sentence[max_chars:]
+            if sentence:
+                pieces.append(sentence)
+
+    # Greedily pack pieces back together up to max_chars
+    chunks = []
+    current = ""
+    for piece in pieces:
+        candidate = f"{current}\n\n{piece}" if current else piece
+        if len(candidate) <= max_chars:
+            current = candidate
+        else:
+            chunks.append(current)
+            current = piece
+    if current:
+        chunks.append(current)
+
+    return chunks
 
 
 class AudioService:
     """Service for generating podcast audio from text."""
 
-    def __init__(self, provider: TTSProvider):
+    def __init__(
+        self,
+        provider: TTSProvider,
+        max_concurrency: int = MAX_CONCURRENT_TTS_REQUESTS,
+    ):
         """
         Initialize audio service.
 
         Args:
             provider: TTS provider to use for audio generation
+            max_concurrency: Maximum TTS requests in flight at once, shared
+                            by all papers processed through this service
         """
         self.provider = provider
-        logger.info(f"Initialized AudioService with {provider.__class__.__name__}")
+        self.max_concurrency = max_concurrency
+        # Papers are processed on several threads and each may split its
+        # text into several chunks; one shared bound keeps the total number
+        # of concurrent provider requests fixed instead of papers x chunks
+        self._request_slots = threading.BoundedSemaphore(max_concurrency)
+        logger.info("Initialized AudioService with %s", provider.__class__.__name__)
 
     def generate_audio(
         self,
@@ -69,7 +142,7 @@ class AudioService:
             )
             print(f"Audio saved to: {result.audio_path}")
         """
-        logger.info(f"Generating audio for {base_filename}")
+        logger.info("Generating audio for %s", base_filename)
 
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
@@ -78,16 +151,43 @@ class AudioService:
         audio_filename = f"{base_filename}.mp3"
         audio_path = output_dir / audio_filename
 
-        # Generate audio
-        self.provider.generate_audio(
-            text=clean_text_for_tts(text),
-            voice=voice,
-            output_path=audio_path,
-        )
-
-        logger.info(f"Generated audio: {audio_path}")
+        chunks = split_text_for_tts(clean_text_for_tts(text))
+
+        # Write to a partial file and rename it into place, so a failed or
+        # interrupted generation never leaves a truncated *.mp3 that the
+        # resume loaders or the library index would pick up
+        partial_path = audio_path.with_suffix(".mp3.part")
+        try:
+            if len(chunks) <= 1:
+                # Single request: stream straight to disk
+                with self._request_slots:
+                    self.provider.generate_audio(
+                        text=chunks[0] if chunks else "",
+                        voice=voice,
+                        output_path=partial_path,
+                    )
+            else:
+                # Chunks are independent, so synthesize them concurrently and
+                # concatenate the MP3 segments in their original order
+                logger.info("Synthesizing %d chunks concurrently", len(chunks))
+                max_workers = min(self.max_concurrency, len(chunks))
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    segments = list(
+                        executor.map(lambda chunk: self._synthesize(chunk, voice), chunks)
+                    )
+                partial_path.write_bytes(b"".join(segments))
+            os.replace(partial_path, audio_path)
+        finally:
+            partial_path.unlink(missing_ok=True)
+
+        logger.info("Generated audio: %s", audio_path)
 
         return AudioResult(
             audio_path=audio_path,
             generated_at=datetime.now(),
         )
+
+    def _synthesize(self, text: str, voice: Optional[str]) -> bytes:
+        """Synthesize one chunk once a request slot is free."""
+        with self._request_slots:
+            return self.provider.synthesize(text, voice)
@@ -0,0 +1,309 @@
+"""SQLite-backed index of processed papers for fast library loading."""
+
+import logging
+import os
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import orjson
+
+from ..models.paper import Paper
+
+logger = logging.getLogger(__name__)
+
+REBUILD_WORKERS = 16  # threads used to scan paper directories during rebuild
+STATE_FILENAME = "paper_state.json"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS papers (
+    paper_dir TEXT PRIMARY KEY,
+    arxiv_id TEXT,
+    title TEXT,
+    authors_json TEXT,
+    abstract TEXT,
+    status TEXT,
+    listen_status TEXT,
+    last_listened_at TEXT,
+    audio_path TEXT,
+    summary_path TEXT,
+    extract_path TEXT,
+    mtime REAL
+)
+"""
+# mtime holds the state file's modification time when the row was built, so
+# load() can detect papers that changed on disk without going through upsert
+
+# Artifact subdirectory -> filename predicate
+_ARTIFACT_MATCHERS = {
+    "audio": lambda name: name.endswith(".mp3"),
+    "summaries": lambda name: name.startswith("summary_") and name.endswith(".txt"),
+    "extracted": lambda name: name.endswith(".md"),
+}
+
+_COLUMNS = (
+    "paper_dir, arxiv_id, title, authors_json, abstract, status, listen_status, "
+    "last_listened_at, audio_path, summary_path, extract_path, mtime"
+)
+
+
+class LibraryIndex:
+    """
+    Index of processed papers stored in a single SQLite database.
+
+    Loading the library from the index is one query instead of a JSON parse
+    and several directory scans per paper. The pipeline upserts a row each
+    time a paper's state is saved. load() compares the rows with the state
+    files on disk (one stat per paper) and calls rebuild() when papers were
+    added, changed or removed outside the index, e.g. libraries created
+    before the index existed or paper directories deleted by hand.
+    """
+
+    def __init__(self, storage_dir: Path):
+        """
+        Initialize the index, creating the database if needed.
+
+        Args:
+            storage_dir: Root storage directory (e.g., "data")
+        """
+        self.storage_dir = Path(storage_dir)
+        self.papers_dir = self.storage_dir / "papers"
+        self.db_path = self.storage_dir / "library_index.sqlite"
+
+        self.storage_dir.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a short-lived connection (safe to use from worker threads)."""
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _scan_paper_dir(paper_dir: Path) -> Tuple[Optional[float], tuple]:
+        """
+        Inspect a paper directory with a single os.scandir pass.
+
+        The state file check and the artifact subdirectory lookups use the
+        cached DirEntry types from one directory read, instead of separate
+        exists()/is_dir() probes and one glob per artifact type.
+
+        Args:
+            paper_dir: Paper directory
+
+        Returns:
+            Tuple of (state_mtime, (audio_path, summary_path, extract_path)),
+            where state_mtime is None without a state file and missing
+            artifacts are None
+        """
+        state_mtime = None
+        artifact_dirs = []
+        found = {}
+
+        try:
+            with os.scandir(paper_dir) as entries:
+                for entry in entries:
+                    if entry.name == STATE_FILENAME:
+                        if entry.is_file():
+                            state_mtime = entry.stat().st_mtime
+                    elif entry.name in _ARTIFACT_MATCHERS and entry.is_dir():
+                        artifact_dirs.append(entry)
+
+            for entry in artifact_dirs:
+                matches = _ARTIFACT_MATCHERS[entry.name]
+                with os.scandir(entry.path) as artifact_entries:
+                    for artifact in artifact_entries:
+                        if matches(artifact.name):
+                            found[entry.name] = artifact.path
+                            break
+        except FileNotFoundError:
+            pass
+
+        artifacts = (found.get("audio"), found.get("summaries"), found.get("extracted"))
+        return state_mtime, artifacts
+
+    @staticmethod
+    def _build_row(
+        paper_data: dict, paper_dir: Path, artifacts: tuple, state_mtime: float
+    ) -> tuple:
+        """
+        Build an index row from serialized paper state.
+
+        Args:
+            paper_data: Paper state as produced by Paper.to_dict()
+            paper_dir: Paper directory
+            artifacts: (audio_path, summary_path, extract_path) from _scan_paper_dir
+            state_mtime: Modification time of the paper's state file
+
+        Returns:
+            Row tuple matching _COLUMNS
+        """
+        audio_path, summary_path, extract_path = artifacts
+
+        return (
+            str(paper_dir),
+            paper_data.get("arxiv_id", ""),
+            paper_data.get("title", "Unknown"),
+            orjson.dumps(paper_data.get("authors", [])).decode("utf-8"),
+            paper_data.get("abstract", ""),
+            paper_data.get("status", "unknown"),
+            paper_data.get("listen_status", "unlistened"),
+            paper_data.get("last_listened_at"),
+            audio_path,
+            summary_path,
+            extract_path,
+            state_mtime,
+        )
+
+    @staticmethod
+    def _row_to_dict(row: tuple) -> dict:
+        """Convert an index row to the library entry format used by the UI."""
+        (
+            paper_dir, arxiv_id, title, authors_json, abstract, status,
+            listen_status, last_listened_at, audio_path, summary_path,
+            extract_path, _mtime,
+        ) = row
+
+        return {
+            "title": title,
+            "arxiv_id": arxiv_id,
+            "authors": orjson.loads(authors_json),
+            "status": status,
+            "abstract": abstract,
+            "audio_path": Path(audio_path) if audio_path else None,
+            "summary_path": Path(summary_path) if summary_path else None,
+            "extract_path": Path(extract_path) if extract_path else None,
+            "paper_dir": Path(paper_dir),
+            "listen_status": listen_status,
+            "last_listened_at": last_listened_at,
+        }
+
+    def upsert(self, paper: Paper) -> None:
+        """
+        Insert or update the index entry for a paper.
+
+        Args:
+            paper: Paper whose state was just saved
+        """
+        paper_dir = self.papers_dir / paper.cleaned_title
+        state_mtime, artifacts = self._scan_paper_dir(paper_dir)
+        if state_mtime is None:
+            # Not saved to disk (yet); load() would drop the row again
+            return
+        row = self._build_row(paper.to_dict(), paper_dir, artifacts, state_mtime)
+
+        with self._connect() as conn:
+            conn.execute(
+                f"INSERT OR REPLACE INTO papers ({_COLUMNS}) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                row,
+            )
+
+    def _index_paper_dir(self, paper_dir: Path) -> Optional[tuple]:
+        """
+        Build an index row from a paper directory on disk.
+
+        Args:
+            paper_dir: Paper directory
+
+        Returns:
+            Row tuple, or None if the directory holds no readable paper state
+        """
+        state_mtime, artifacts = self._scan_paper_dir(paper_dir)
+        if state_mtime is None:
+            return None
+
+        try:
+            paper_data = orjson.loads((paper_dir / STATE_FILENAME).read_bytes())
+            return self._build_row(paper_data, paper_dir, artifacts, state_mtime)
+        except Exception as e:
+            logger.error(f"Error indexing paper from {paper_dir}: {e}")
+            return None
+
+    def rebuild(self) -> int:
+        """
+        Recreate the index from the paper directories on disk.
+
+        Returns:
+            Number of papers indexed
+        """
+        paper_dirs = []
+        if self.papers_dir.exists():
+            with os.scandir(self.papers_dir) as entries:
+                paper_dirs = [Path(entry.path) for entry in entries if entry.is_dir()]
+
+        # Per-paper reads are independent and dominated by filesystem latency
+        with ThreadPoolExecutor(max_workers=REBUILD_WORKERS) as executor:
+            rows = [
+                row for row in executor.map(self._index_paper_dir, paper_dirs)
+                if row is not None
+            ]
+
+        with self._connect() as conn:
+            conn.execute("DELETE FROM papers")
+            conn.executemany(
+                f"INSERT INTO papers ({_COLUMNS}) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+        logger.info(f"Rebuilt library index with {len(rows)} papers")
+        return len(rows)
+
+    def _state_mtimes_on_disk(self) -> Dict[str, float]:
+        """
+        Map each paper directory that has a state file to the file's mtime.
+
+        Returns:
+            Dict of paper_dir (as stored in the index) -> state file mtime
+        """
+        mtimes = {}
+        try:
+            with os.scandir(self.papers_dir) as entries:
+                for entry in entries:
+                    if not entry.is_dir():
+                        continue
+                    try:
+                        mtimes[entry.path] = os.stat(
+                            os.path.join(entry.path, STATE_FILENAME)
+                        ).st_mtime
+                    except FileNotFoundError:
+                        continue
+        except FileNotFoundError:
+            pass
+        return mtimes
+
+    def load(self) -> List[dict]:
+        """
+        Load all indexed papers, most recently updated first.
+
+        Rebuilds the index from disk when it does not match the paper
+        directories: papers missing from the index (e.g., libraries created
+        before the index), papers whose state file changed since they were
+        indexed, and rows whose directory or state file is gone.
+
+        Returns:
+            List of library entry dicts
+        """
+        rows = self._select_all()
+
+        indexed = {row[0]: row[-1] for row in rows}
+        if indexed != self._state_mtimes_on_disk():
+            self.rebuild()
+            rows = self._select_all()
+
+        return [self._row_to_dict(row) for row in rows]
+
+    def _select_all(self) -> List[tuple]:
+        """Fetch all index rows ordered by last update."""
+        with self._connect() as conn:
+            return conn.execute(
+                f"SELECT {_COLUMNS} FROM papers ORDER BY mtime DESC"
+            ).fetchall()
@@ -7,6 +7,8 @@ from pathlib import Path
 from typing import Optional
 from anthropic import Anthropic
 
+from .rate_limiter import RateLimiter, estimate_tokens
+
 logger = logging.getLogger(__name__)
 
 
@@ -41,6 +43,7 @@ class AnthropicProvider(LLMProvider):
         self,
         api_key: Optional[str] = None,
         model: str = "claude-haiku-4-5",
+        rate_limiter: Optional[RateLimiter] = None,
     ):
         """
         Initialize the Anthropic provider.
@@ -48,6 +51,8 @@ class AnthropicProvider(LLMProvider):
         Args:
             api_key: Anthropic API key (if None, reads from ANTHROPIC_API_KEY env var)
             model: Model to use (default: claude-haiku-4-5)
+            rate_limiter: Client-side rate limiter (if None, built from the
+                         ANTHROPIC_RPM and ANTHROPIC_TPM env vars)
         """
         self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
         if not self.api_key:
@@ -56,6 +61,7 @@ class AnthropicProvider(LLMProvider):
             )
 
         self.model = model
+        self.rate_limiter = rate_limiter or RateLimiter.from_env("ANTHROPIC")
         self.client = Anthropic(api_key=self.api_key)
         logger.info(f"Initialized Anthropic provider with model: {self.model}")
 
@@ -78,6 +84,8 @@ class AnthropicProvider(LLMProvider):
         """
         logger.info(f"Generating response with {self.model}")
 
+        self.rate_limiter.acquire(tokens=estimate_tokens(prompt))
+
         try:
             message = self.client.messages.create(
                 model=self.model,
@@ -1,8 +1,11 @@
 """Service for LLM-based paper summarization."""
 
 import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
+from typing import Dict, List
 
 from .llm_providers import LLMProvider
 from ..models.paper import Paper
@@ -10,6 +13,58 @@ from ..models.summary_result import SummaryResult
 
 logger = logging.getLogger(__name__)
 
+CHUNKED_SUMMARY_THRESHOLD = 20_000  # characters; longer papers are summarized in chunks
+DEFAULT_CHUNK_CHARS = 10_000
+MAX_CONCURRENT_CHUNK_REQUESTS = 4
+CHUNK_PROMPT_NAME = "summarize_chunk"
+
+# Markdown headings up to level 3 start a new section
+_SECTION_HEADING = re.compile(r"^#{1,3}\s", re.MULTILINE)
+
+
+def split_markdown_sections(markdown: str, chunk_chars: int = DEFAULT_CHUNK_CHARS) -> List[str]:
+    """
+    Split markdown into chunks of at most chunk_chars along section headings.
+
+    Adjacent sections are merged greedily up to the limit. Sections that are
+    longer than the limit on their own are split on paragraph boundaries,
+    and oversized paragraphs are hard-split as a last resort.
+
+    Args:
+        markdown: Markdown text to split
+        chunk_chars: Maximum characters per chunk
+
+    Returns:
+        List of chunks in document order
+    """
+    starts = [match.start() for match in _SECTION_HEADING.finditer(markdown)]
+    if not starts or starts[0] != 0:
+        starts.insert(0, 0)
+    bounds = starts + [len(markdown)]
+
+    pieces = []
+    for start, end in zip(bounds, bounds[1:]):
+        section = markdown[start:end]
+        if len(section) <= chunk_chars:
+            pieces.append(section)
+            continue
+        for paragraph in section.split("\n\n"):
+            paragraph += "\n\n"
+            for i in range(0, len(paragraph), chunk_chars):
+                pieces.append(paragraph[i:i + chunk_chars])
+
+    chunks = []
+    current = ""
+    for piece in pieces:
+        if current and len(current) + len(piece) > chunk_chars:
+            chunks.append(current)
+            current = ""
+        current += piece
+    if current.strip():
+        chunks.append(current)
+
+    return [chunk.strip() for chunk in chunks if chunk.strip()]
+
 
 class LLMService:
     """Service for summarizing papers using LLMs."""
@@ -28,6 +83,7 @@ class LLMService:
         """
         self.provider = provider
         self.prompts_dir = Path(prompts_dir)
+        self._prompts: Dict[str, str] = {}  # prompt name -> template, read once
 
         if not self.prompts_dir.exists():
             raise ValueError(f"Prompts directory does not exist: {self.prompts_dir}")
@@ -38,6 +94,9 @@ class LLMService:
         """
         Load a prompt template from the prompts directory.
 
+        Each template is read from disk once and then served from memory,
+        so edits to a prompt file take effect when the service is recreated.
+
         Args:
             prompt_name: Name of the prompt file (without .txt extension)
 
@@ -47,15 +106,20 @@ class LLMService:
         Raises:
             FileNotFoundError: If prompt file doesn't exist
         """
-        prompt_path = self.prompts_dir / f"{prompt_name}.txt"
-
-        if not prompt_path.exists():
-            raise FileNotFoundError(f"Prompt file not found: {prompt_path}")
+        prompt = self._prompts.get(prompt_name)
+        if prompt is not None:
+            return prompt
 
+        prompt_path = self.prompts_dir / f"{prompt_name}.txt"
         logger.debug(f"Loading prompt from: {prompt_path}")
 
-        with open(prompt_path, "r", encoding="utf-8") as f:
-            return f.read()
+        try:
+            prompt = prompt_path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Prompt file not found: {prompt_path}") from None
+
+        self._prompts[prompt_name] = prompt
+        return prompt
 
     def _format_prompt(
         self,
@@ -74,17 +138,11 @@ class LLMService:
         Returns:
             prompt_template: Formatted prompt string
         """
-        # Format authors as comma-separated string
-        authors_str = ", ".join([author.name for author in paper.authors])
-
-        # Format published date
-        published_str = paper.published.strftime("%B %Y")
-
         prompt_template = template.format(
             paper_content=paper_content,
             title=paper.title,
-            authors=authors_str,
-            published=published_str
+            authors=paper.authors_str,
+            published=paper.published.strftime("%B %Y"),
             )
 
         return prompt_template
@@ -115,6 +173,11 @@ class LLMService:
 
         logger.info(f"Summarizing paper: {paper.title}")
 
+        # Long papers are condensed chunk by chunk before the final summary,
+        # which keeps every request well below the full paper's context size
+        if len(extracted_content) > CHUNKED_SUMMARY_THRESHOLD:
+            extracted_content = self.summarize_chunked(paper, extracted_content)
+
         # Load and format prompt
         prompt_template = self._load_prompt(prompt_name)
         formatted_prompt = self._format_prompt(
@@ -149,3 +212,56 @@ class LLMService:
             saved_path=summary_path,
             summarized_at=datetime.now(),
         )
+
+    def summarize_chunked(
+        self,
+        paper: Paper,
+        markdown: str,
+        chunk_chars: int = DEFAULT_CHUNK_CHARS,
+        max_tokens: int = 1024,
+        temperature: float = 0.3,
+    ) -> str:
+        """
+        Condense long paper content into notes, one LLM call per chunk.
+
+        The markdown is split along section headings into chunks of at most
+        chunk_chars, which are summarized concurrently. The notes are joined
+        in document order and used in place of the full text for the final
+        summary prompt.
+
+        Args:
+            paper: Paper metadata
+            markdown: Extracted markdown content
+            chunk_chars: Maximum characters per chunk
+            max_tokens: Maximum tokens to generate per chunk
+            temperature: Sampling temperature
+
+        Returns:
+            Condensed notes covering the whole paper
+        """
+        chunks = split_markdown_sections(markdown, chunk_chars)
+        template = self._load_prompt(CHUNK_PROMPT_NAME)
+
+        logger.info(f"Condensing {len(markdown)} characters in {len(chunks)} chunks")
+
+        def summarize_chunk(numbered_chunk):
+            part_number, chunk = numbered_chunk
+            prompt = template.format(
+                paper_content=chunk,
+                title=paper.title,
+                part_number=part_number,
+                part_count=len(chunks),
+            )
+            return self.provider.generate(
+                prompt=prompt,
+                max_tokens=max_tokens,
+                temperature=temperature,
+            )
+
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_CHUNK_REQUESTS) as executor:
+            notes = list(executor.map(summarize_chunk, enumerate(chunks, start=1)))
+
+        return "\n\n".join(
+            f"Part {part_number}:\n{note.strip()}"
+            for part_number, note in enumerate(notes, start=1)
+        )
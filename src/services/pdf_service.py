@@ -1,9 +1,14 @@
 """Service for extracting content from PDF files using MarkItDown."""
 
+import io
 import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
 from typing import Optional
-from markitdown import MarkItDown
+from markitdown import MarkItDown, StreamInfo
 from datetime import datetime
 from ..models.extracted_content import ExtractedContent
 from ..models.extraction_result import ExtractionResult
@@ -11,13 +16,93 @@ from ..models.extraction_result import ExtractionResult
 
 logger = logging.getLogger(__name__)
 
+try:
+    MARKITDOWN_VERSION = version("markitdown")
+except PackageNotFoundError:  # e.g. running from a source checkout
+    MARKITDOWN_VERSION = "unknown"
+
+# Converter used inside extraction worker processes (one per process)
+_worker_converter: Optional[MarkItDown] = None
+
+# Converter shared by all PdfService instances that convert in-process
+_shared_converter: Optional[MarkItDown] = None
+_shared_converter_lock = threading.Lock()
+
+
+def _get_shared_converter() -> MarkItDown:
+    """Get the in-process converter, creating it on first use."""
+    global _shared_converter
+    if _shared_converter is None:
+        with _shared_converter_lock:
+            if _shared_converter is None:
+                _shared_converter = MarkItDown()
+    return _shared_converter
+
+
+def _convert_pdf_in_worker(pdf_path: str) -> str:
+    """Convert a PDF to markdown inside an extraction worker process."""
+    global _worker_converter
+    if _worker_converter is None:
+        _worker_converter = MarkItDown()
+    return _worker_converter.convert(pdf_path).text_content
+
+
+def _convert_pdf_bytes_in_worker(pdf_bytes: bytes) -> str:
+    """Convert in-memory PDF contents to markdown inside a worker process."""
+    global _worker_converter
+    if _worker_converter is None:
+        _worker_converter = MarkItDown()
+    return _convert_pdf_bytes(_worker_converter, pdf_bytes)
+
+
+def _convert_pdf_bytes(converter: MarkItDown, pdf_bytes: bytes) -> str:
+    """Convert in-memory PDF contents to markdown with the given converter."""
+    result = converter.convert_stream(
+        io.BytesIO(pdf_bytes),
+        stream_info=StreamInfo(mimetype="application/pdf", extension=".pdf"),
+    )
+    return result.text_content
+
 
 class PdfService:
     """Service for extracting markdown content from PDF files."""
 
-    def __init__(self):
-        """Initialize the PDF service with MarkItDown converter."""
-        self.converter = MarkItDown()
+    def __init__(self, extraction_workers: int = 0):
+        """
+        Initialize the PDF service with MarkItDown converter.
+
+        Args:
+            extraction_workers: Number of worker processes used for PDF
+                               conversion. PDF parsing is CPU-bound and holds
+                               the GIL, so concurrent extractions only overlap
+                               when they run in separate processes. 0 converts
+                               in the calling process.
+        """
+        # Part of extraction cache keys, so upgrading MarkItDown re-extracts
+        self.converter_version = MARKITDOWN_VERSION
+        self.extraction_workers = extraction_workers
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+
+    @property
+    def converter(self) -> MarkItDown:
+        """MarkItDown converter for in-process extraction (shared, created lazily)."""
+        return _get_shared_converter()
+
+    def _get_pool(self) -> Optional[ProcessPoolExecutor]:
+        """Get the extraction process pool, creating it on first use."""
+        if self.extraction_workers <= 0:
+            return None
+
+        with self._pool_lock:
+            if self._pool is None:
+                # spawn avoids forking a multi-threaded parent (e.g. Streamlit)
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.extraction_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+                logger.info(f"Started {self.extraction_workers} PDF extraction workers")
+            return self._pool
 
     def extract(self, pdf_path: str | Path) -> ExtractedContent:
         """
@@ -47,10 +132,14 @@ class PdfService:
 
         try:
             # Convert PDF to markdown
-            result = self.converter.convert(str(pdf_path))
+            pool = self._get_pool()
+            if pool:
+                markdown = pool.submit(_convert_pdf_in_worker, str(pdf_path)).result()
+            else:
+                markdown = self.converter.convert(str(pdf_path)).text_content
 
             content = ExtractedContent(
-                markdown=result.text_content
+                markdown=markdown
             )
 
             logger.info(
@@ -63,6 +152,42 @@ class PdfService:
             logger.error(f"Failed to extract content from {pdf_path}: {e}")
             raise
 
+    def extract_bytes(self, pdf_bytes: bytes) -> ExtractedContent:
+        """
+        Extract content from PDF contents already held in memory.
+
+        Args:
+            pdf_bytes: Contents of a PDF file
+
+        Returns:
+            ExtractedContent with markdown
+
+        Raises:
+            Exception: If extraction fails
+        """
+        logger.info(f"Extracting content from {len(pdf_bytes)} bytes of PDF data")
+
+        try:
+            pool = self._get_pool()
+            if pool:
+                markdown = pool.submit(_convert_pdf_bytes_in_worker, pdf_bytes).result()
+            else:
+                markdown = _convert_pdf_bytes(self.converter, pdf_bytes)
+
+            content = ExtractedContent(
+                markdown=markdown
+            )
+
+            logger.info(
+                f"Successfully extracted {len(content.markdown)} characters"
+            )
+
+            return content
+
+        except Exception as e:
+            logger.error(f"Failed to extract content from PDF data: {e}")
+            raise
+
     def save(
         self,
         content: ExtractedContent,
@@ -102,6 +227,7 @@ class PdfService:
         pdf_path: str | Path,
         output_dir: str | Path,
         base_filename: Optional[str] = None,
+        pdf_bytes: Optional[bytes] = None,
     ) -> ExtractionResult:
         """
         Extract content from PDF and save it.
@@ -110,6 +236,8 @@ class PdfService:
             pdf_path: Path to the PDF file
             output_dir: Directory where markdown should be saved
             base_filename: Base name for output file (defaults to PDF filename)
+            pdf_bytes: Contents of pdf_path if already in memory (skips
+                      reading the file)
 
         Returns:
             ExtractionResult with content and metadata
@@ -124,7 +252,10 @@ class PdfService:
             print(f"Saved to: {result.saved_path}")
         """
         # Extract content
-        content = self.extract(pdf_path)
+        if pdf_bytes is not None:
+            content = self.extract_bytes(pdf_bytes)
+        else:
+            content = self.extract(pdf_path)
 
         # Determine base filename
         if base_filename is None:
@@ -0,0 +1,134 @@
+"""Client-side rate limiting for provider API calls."""
+
+import logging
+import os
+import threading
+import time
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Roughly estimate the number of tokens in a piece of text.
+
+    Args:
+        text: Text to estimate
+
+    Returns:
+        Estimated token count (about 4 characters per token)
+    """
+    return max(1, len(text) // 4)
+
+
+class _TokenBucket:
+    """Token bucket refilled continuously at a per-minute rate."""
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.refill_rate = self.capacity / 60.0  # tokens per second
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self.updated_at
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_rate)
+        self.updated_at = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until amount tokens are available (0 if available now)."""
+        self._refill(now)
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.refill_rate
+
+    def consume(self, amount: float) -> None:
+        self.tokens -= min(amount, self.capacity)
+
+
+class RateLimiter:
+    """
+    Thread-safe token-bucket limiter for requests and tokens per minute.
+
+    Callers block in acquire() until both budgets allow the request, which
+    keeps throughput near the provider's limits instead of bouncing off
+    429 responses when many papers are processed concurrently.
+
+    Example:
+        limiter = RateLimiter(requests_per_minute=50, tokens_per_minute=40000)
+        limiter.acquire(tokens=estimate_tokens(prompt))
+        client.messages.create(...)
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+    ):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            requests_per_minute: Request budget per minute (None for no limit)
+            tokens_per_minute: Token budget per minute (None for no limit)
+        """
+        self._lock = threading.Lock()
+        self._requests = _TokenBucket(requests_per_minute) if requests_per_minute else None
+        self._tokens = _TokenBucket(tokens_per_minute) if tokens_per_minute else None
+
+    @classmethod
+    def from_env(cls, prefix: str) -> "RateLimiter":
+        """
+        Create a limiter from {prefix}_RPM and {prefix}_TPM environment variables.
+
+        Unset variables leave the corresponding budget unlimited.
+
+        Args:
+            prefix: Environment variable prefix (e.g., "ANTHROPIC")
+
+        Returns:
+            Configured RateLimiter
+        """
+        rpm = os.getenv(f"{prefix}_RPM")
+        tpm = os.getenv(f"{prefix}_TPM")
+
+        return cls(
+            requests_per_minute=float(rpm) if rpm else None,
+            tokens_per_minute=float(tpm) if tpm else None,
+        )
+
+    @property
+    def is_enabled(self) -> bool:
+        """Check if any limit is configured."""
+        return self._requests is not None or self._tokens is not None
+
+    def acquire(self, tokens: int = 0) -> None:
+        """
+        Block until a request using the given number of tokens is allowed.
+
+        Args:
+            tokens: Estimated tokens consumed by the request
+        """
+        if not self.is_enabled:
+            return
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                wait = 0.0
+                if self._requests:
+                    wait = max(wait, self._requests.wait_time(1, now))
+                if self._tokens and tokens:
+                    wait = max(wait, self._tokens.wait_time(tokens, now))
+
+                if wait <= 0:
+                    if self._requests:
+                        self._requests.consume(1)
+                    if self._tokens and tokens:
+                        self._tokens.consume(tokens)
+                    return
+
+            logger.debug(f"Rate limiting: sleeping for {wait:.2f} seconds")
+            time.sleep(wait)
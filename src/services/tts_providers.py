@@ -1,13 +1,25 @@
 """Text-to-Speech provider implementations."""
 
+import importlib.util
 import logging
 import os
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Optional
 
+from .rate_limiter import RateLimiter
+
 logger = logging.getLogger(__name__)
 
+# Concurrent chunk requests multiplex over one HTTP/2 connection when the
+# h2 package (httpx[http2]) is installed; otherwise they use HTTP/1.1
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Retries for 408/409/429/5xx and connection errors. The SDK backs off
+# exponentially with jitter and honours Retry-After; its default of 2 is
+# easily exhausted when many chunks hit a rate limit at once.
+TTS_MAX_RETRIES = 5
+
 
 class TTSProvider(ABC):
     """Abstract base class for Text-to-Speech providers."""
@@ -32,6 +44,24 @@ class TTSProvider(ABC):
         """
         pass
 
+    @abstractmethod
+    def synthesize(
+        self,
+        text: str,
+        voice: Optional[str] = None,
+    ) -> bytes:
+        """
+        Generate audio from text and return the encoded bytes.
+
+        Args:
+            text: Text to convert to speech
+            voice: Voice to use (uses provider default if None)
+
+        Returns:
+            Encoded audio bytes
+        """
+        pass
+
 
 class OpenAITTSProvider(TTSProvider):
     """OpenAI Text-to-Speech provider."""
@@ -41,6 +71,7 @@ class OpenAITTSProvider(TTSProvider):
         api_key: Optional[str] = None,
         model: str = "gpt-4o-mini-tts",
         voice: str = "alloy",
+        rate_limiter: Optional[RateLimiter] = None,
     ):
         """
         Initialize OpenAI TTS provider.
@@ -49,6 +80,8 @@ class OpenAITTSProvider(TTSProvider):
             api_key: OpenAI API key (reads from OPENAI_API_KEY env var if None)
             model: TTS model (gpt-4o-mini-tts)
             voice: Default voice (alloy, echo, fable, onyx, nova, shimmer)
+            rate_limiter: Client-side rate limiter (if None, built from the
+                         OPENAI_TTS_RPM env var)
         """
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         if not self.api_key:
@@ -58,16 +91,22 @@ class OpenAITTSProvider(TTSProvider):
 
         self.model = model
         self.voice = voice
+        self.rate_limiter = rate_limiter or RateLimiter.from_env("OPENAI_TTS")
 
         try:
-            from openai import OpenAI
-            self.client = OpenAI(api_key=self.api_key)
+            from openai import DefaultHttpxClient, OpenAI
+            self.client = OpenAI(
+                api_key=self.api_key,
+                max_retries=TTS_MAX_RETRIES,
+                # Keeps the SDK's default keep-alive pool limits
+                http_client=DefaultHttpxClient(http2=HTTP2_AVAILABLE),
+            )
         except ImportError:
             raise ImportError(
                 "OpenAI package not installed. Install: pip install openai"
             )
 
-        logger.info(f"Initialized OpenAI TTS: model={model}, voice={voice}")
+        logger.info("Initialized OpenAI TTS: model=%s, voice=%s", model, voice)
 
     def generate_audio(
         self,
@@ -88,7 +127,7 @@ class OpenAITTSProvider(TTSProvider):
         """
         voice = voice or self.voice
 
-        logger.info(f"Generating audio: model={self.model}, voice={voice}")
+        logger.info("Generating audio: model=%s, voice=%s", self.model, voice)
 
         try:
             # Generate output path if not provided
@@ -98,6 +137,8 @@ class OpenAITTSProvider(TTSProvider):
             output_file = Path(output_path)
             output_file.parent.mkdir(parents=True, exist_ok=True)
 
+            self.rate_limiter.acquire()
+
             # Stream audio to file
             with self.client.audio.speech.with_streaming_response.create(
                 model=self.model,
@@ -107,9 +148,47 @@ class OpenAITTSProvider(TTSProvider):
             ) as response:
                 response.stream_to_file(str(output_file))
 
-            logger.info(f"Audio saved to: {output_file}")
+            logger.info("Audio saved to: %s", output_file)
             return str(output_file)
 
         except Exception as e:
-            logger.error(f"Error generating audio: {e}")
+            logger.error("Error generating audio: %s", e)
+            raise
+
+    def synthesize(
+        self,
+        text: str,
+        voice: Optional[str] = None,
+    ) -> bytes:
+        """
+        Generate audio using OpenAI TTS and return the MP3 bytes.
+
+        Safe to call from multiple threads; requests share the client's
+        connection pool.
+
+        Args:
+            text: Text to convert to speech
+            voice: Voice to use (uses default if None)
+
+        Returns:
+            MP3-encoded audio bytes
+        """
+        voice = voice or self.voice
+
+        logger.info(
+            "Synthesizing audio: model=%s, voice=%s, chars=%d", self.model, voice, len(text)
+        )
+
+        try:
+            self.rate_limiter.acquire()
+            response = self.client.audio.speech.create(
+                model=self.model,
+                voice=voice,
+                input=text,
+                instructions="The text includes markdown and/or html formatting tags which should be treated as such."
+            )
+            return response.content
+
+        except Exception as e:
+            logger.error("Error synthesizing audio: %s", e)
             raise
@@ -0,0 +1,40 @@
+"""Tests for arXiv OAI-PMH set mapping."""
+
+import unittest
+
+from src.services.arxiv_service import _oai_set_spec
+
+
+class OaiSetSpecTest(unittest.TestCase):
+    def test_non_physics_archive(self):
+        for archive in ("cs", "math", "stat", "q-bio", "q-fin", "econ", "eess"):
+            with self.subTest(archive=archive):
+                self.assertEqual(_oai_set_spec(archive), (archive, None))
+
+    def test_non_physics_category(self):
+        self.assertEqual(_oai_set_spec("cs.AI"), ("cs", "cs.AI"))
+        self.assertEqual(_oai_set_spec("q-fin.ST"), ("q-fin", "q-fin.ST"))
+
+    def test_physics_archive(self):
+        for archive in (
+            "astro-ph", "cond-mat", "gr-qc", "hep-ex", "hep-lat", "hep-ph",
+            "hep-th", "math-ph", "nlin", "nucl-ex", "nucl-th", "physics", "quant-ph",
+        ):
+            with self.subTest(archive=archive):
+                self.assertEqual(_oai_set_spec(archive), (f"physics:{archive}", None))
+
+    def test_physics_category(self):
+        self.assertEqual(_oai_set_spec("cond-mat.str-el"), ("physics:cond-mat", "cond-mat.str-el"))
+        self.assertEqual(_oai_set_spec("astro-ph.CO"), ("physics:astro-ph", "astro-ph.CO"))
+        self.assertEqual(_oai_set_spec("physics.optics"), ("physics:physics", "physics.optics"))
+        self.assertEqual(_oai_set_spec("nlin.AO"), ("physics:nlin", "nlin.AO"))
+
+    def test_explicit_physics_set(self):
+        self.assertEqual(_oai_set_spec("physics:hep-th"), ("physics:hep-th", None))
+        self.assertEqual(
+            _oai_set_spec("physics:cond-mat.str-el"), ("physics:cond-mat", "cond-mat.str-el")
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+"""Tests for the TTS text helpers in the audio service."""
+
+import random
+import re
+import unittest
+
+from src.services.audio_service import clean_text_for_tts
+
+
+def baseline_clean_text_for_tts(text: str) -> str:
+    """The original two-pass implementation."""
+    text = re.sub(r'<[^>]+>', '', text)
+    return re.sub(r'^#{1,6}\s+', '', text, flags=re.MULTILINE)
+
+
+class CleanTextForTtsTest(unittest.TestCase):
+    def test_tag_wrapped_headers(self):
+        cases = {
+            "<span>##</span> Heading": "Heading",
+            "<b>#</b> Title": "Title",
+            "<b>## Title</b>": "Title",
+            "##<b></b> Title": "Title",
+            "Intro\n<h2>## Methods</h2>\nText": "Intro\nMethods\nText",
+        }
+        for text, expected in cases.items():
+            with self.subTest(text=text):
+                self.assertEqual(clean_text_for_tts(text), expected)
+                self.assertEqual(clean_text_for_tts(text), baseline_clean_text_for_tts(text))
+
+    def test_plain_text_is_unchanged(self):
+        text = "A plain summary.\n\nWith two paragraphs."
+        self.assertIs(clean_text_for_tts(text), text)
+
+    def test_matches_baseline_on_random_markup(self):
+        rng = random.Random(0)
+        tokens = ["<b>", "</b>", "<span>", "#", "##", "###", " ", "\t", "\n", "\n\n", "Title", "x", "<", ">"]
+        for _ in range(20_000):
+            text = "".join(rng.choice(tokens) for _ in range(rng.randint(0, 12)))
+            self.assertEqual(clean_text_for_tts(text), baseline_clean_text_for_tts(text), repr(text))
+
+
+if __name__ == "__main__":
+    unittest.main()
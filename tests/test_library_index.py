@@ -0,0 +1,79 @@
+"""Tests for the SQLite library index."""
+
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+from src.models.paper import Author, Paper
+from src.services.library_index import LibraryIndex
+
+
+def make_paper(number: int) -> Paper:
+    """Build a minimal paper with a unique title."""
+    return Paper(
+        arxiv_id=f"2401.0000{number}",
+        title=f"Paper {number}",
+        authors=[Author(name="Ada Lovelace")],
+        abstract="Abstract",
+        published=datetime(2024, 1, number),
+        updated=datetime(2024, 1, number),
+        categories=["cs.AI"],
+        primary_category="cs.AI",
+        pdf_url=f"https://arxiv.org/pdf/2401.0000{number}",
+    )
+
+
+class LibraryIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.storage_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.storage_dir)
+
+    def titles(self, index: LibraryIndex) -> list:
+        return sorted(entry["title"] for entry in index.load())
+
+    def test_existing_library_then_process_one_new_paper(self):
+        # Papers saved before the index existed
+        for number in (1, 2, 3):
+            make_paper(number).save_to_disk(self.storage_dir)
+
+        index = LibraryIndex(self.storage_dir)
+        paper = make_paper(4)
+        paper.save_to_disk(self.storage_dir)
+        index.upsert(paper)
+
+        self.assertEqual(self.titles(index), ["Paper 1", "Paper 2", "Paper 3", "Paper 4"])
+
+    def test_deleted_paper_directory_is_dropped(self):
+        index = LibraryIndex(self.storage_dir)
+        for number in (1, 2):
+            paper = make_paper(number)
+            paper.save_to_disk(self.storage_dir)
+            index.upsert(paper)
+        self.assertEqual(self.titles(index), ["Paper 1", "Paper 2"])
+
+        shutil.rmtree(self.storage_dir / "papers" / make_paper(2).cleaned_title)
+
+        self.assertEqual(self.titles(index), ["Paper 1"])
+
+    def test_state_changed_outside_index_is_refreshed(self):
+        index = LibraryIndex(self.storage_dir)
+        paper = make_paper(1)
+        paper.save_to_disk(self.storage_dir)
+        index.upsert(paper)
+
+        # Saved without upsert (e.g., by another process)
+        paper.status = "completed"
+        paper.save_to_disk(self.storage_dir)
+        state_file = self.storage_dir / "papers" / paper.cleaned_title / "paper_state.json"
+        stat = state_file.stat()
+        # Make sure the mtime differs even on coarse-grained filesystems
+        os.utime(state_file, (stat.st_atime, stat.st_mtime + 10))
+
+        self.assertEqual(index.load()[0]["status"], "completed")
+
+
+if __name__ == "__main__":
+    unittest.main()